@@ -1,18 +1,58 @@
 import gymnasium as gym
 import numpy as np
-import pygame
-
-# Import everything needed from your game
-from multi_brick import (
-    GAME_WIDTH, SCREEN_HEIGHT, PADDLE_WIDTH, PADDLE_HEIGHT, PADDLE_SPEED, BALL_RADIUS,
-    Ball, Paddle, AIPaddle, Brick, PowerUp,
-    create_bricks, reset_level,
-    player_brick_stats, ai_brick_stats, player_balls_lost, ai_balls_lost,
-    player_round_score, ai_round_score, player_total_score, ai_total_score,
-    round_number, round_winner, showing_round_summary, round_summary_start_time,
-    # If you use other globals, add them here
+
+# The simulation is pygame-free; pygame is only imported when rendering to a window
+from game_core import (
+    BRICK_COLS, BRICK_ROWS, EVENT_BRICK_BROKEN, EVENT_BRICK_HIT, EVENT_PADDLE_HIT, GAME_WIDTH,
+    SCREEN_HEIGHT, SIDE_PLAYER, GameCore, shared_level_cache,
 )
 
+POWERUP_TYPE_INDEX = {"speed": 0, "size": 1, "multi": 2, "score": 3, "laser": 4, "slow": 5}
+OBS_MODES = ("vector", "grid", "compact")
+VELOCITY_SCALE = 8  # Compact obs store ball velocity in 1/8 px per frame (max speed 12.5 -> 100)
+MAX_EXTRA_BRICKS = 2  # Off-lattice bricks (boss, moving) reported next to the grid
+UNBREAKABLE_HITS = 255  # brick_hits code for unbreakable bricks
+
+def compact_layout(max_balls, max_bricks, max_powerups):
+    """
+    How obs_mode="compact" splits the vector observation: indices kept as int16
+    coordinates, indices kept as int8 (velocities times VELOCITY_SCALE, ball
+    count and types), the scale of each int8 entry, and the vector length.
+    """
+    coords = list(range(6))  # Paddle centres and edges
+    small, scale = [], []
+    for i in range(max_balls):
+        base = 6 + i * 6
+        coords += [base, base + 1, base + 4, base + 5]  # x, y, distances
+        small += [base + 2, base + 3]  # vx, vy
+        scale += [VELOCITY_SCALE, VELOCITY_SCALE]
+    end = 6 + max_balls * 6
+    coords += [end, end + 1, end + 3]  # Closest ball dx/dy, bricks left (up to 141)
+    small.append(end + 2)  # Balls left
+    scale.append(1)
+    end += 4
+    for count in (max_bricks, max_powerups):
+        for i in range(count):
+            base = end + i * 3
+            coords += [base, base + 1]
+            small.append(base + 2)  # Type
+            scale.append(1)
+        end += count * 3
+    return np.array(coords), np.array(small), np.array(scale, dtype=np.float32), end
+
+def decode_compact_obs(obs, layout):
+    """Float32 vector observation(s) from compact ones; works on batches too."""
+    coord_idx, small_idx, small_scale, obs_len = layout
+    coords = np.asarray(obs["coords"])
+    out = np.empty(coords.shape[:-1] + (obs_len,), dtype=np.float32)
+    out[..., coord_idx] = coords
+    out[..., small_idx] = np.asarray(obs["small"]) / small_scale
+    return out
+
+def _hits_code(hits):
+    """Remaining hit points as stored in the uint8 brick_hits grid."""
+    return UNBREAKABLE_HITS if hits < 0 else min(hits, UNBREAKABLE_HITS - 1)
+
 class BrickPongEnv(gym.Env):
     """
     Gym wrapper for Ultimate Brick Pong.
@@ -20,11 +60,33 @@ class BrickPongEnv(gym.Env):
     Observation: [player_x, ai_x, for each ball: x, y, vx, vy (up to max_balls)]
     Action: 0 = stay, 1 = left, 2 = right
     Reward: +1 for breaking a brick, -1 for losing a ball, 0 otherwise.
+    action_repeat: physics ticks run per agent step (frame-skip); rewards are
+    summed over the repeated ticks and the observation is built once at the end.
+    obs_mode="grid": Dict observation with the whole brick field as
+    BRICK_ROWS x BRICK_COLS uint8 grids (hits left, type) plus paddle, ball,
+    off-lattice brick and power-up vectors. The grids are patched from brick
+    events instead of being rebuilt every step.
+    obs_mode="compact": the vector observation as a Dict of int16 coordinates
+    and int8 velocities/counts/types (~2.4x smaller in replay buffers);
+    CompactObsDecoder turns it back into the float32 vector.
+    layout_seeds=N: each reset picks one of N brick layouts per level from the
+    env's seeded np_random, so reset(seed=...) reproduces the layout and
+    resets rebuild bricks from the process-wide level cache (optionally
+    backed by a level pack file, see game_core.build_level_pack).
     """
     metadata = {"render.modes": ["human"]}
 
-    def __init__(self, max_balls=6, rl_mode=True):
+    def __init__(self, max_balls=6, rl_mode=True, action_repeat=1, obs_mode="vector",
+                 layout_seeds=None, level_pack=None):
         super().__init__()
+        if action_repeat < 1:
+            raise ValueError("action_repeat must be at least 1")
+        if obs_mode not in OBS_MODES:
+            raise ValueError(f"obs_mode must be one of {OBS_MODES}, got {obs_mode!r}")
+        self.obs_mode = obs_mode
+        self.layout_seeds = layout_seeds
+        self.level_pack = level_pack
+        self.action_repeat = int(action_repeat)
         self.max_balls = max_balls
         self.max_powerups = 3
         self.max_bricks = 20  # Pad to 20 bricks for obs
@@ -45,64 +107,163 @@ class BrickPongEnv(gym.Env):
 
         self.action_space = gym.spaces.Discrete(3)
 
-        pygame.init()
-        if self.rl_mode:
-            self.screen = pygame.Surface((GAME_WIDTH, SCREEN_HEIGHT))
-        else:
+        # Observation buffer filled in place by _get_obs, with views onto its blocks
+        self._obs = np.zeros(obs_len, dtype=np.float32)
+        self._ball_end = 6 + self.max_balls * 6
+        self._brick_start = self._ball_end + 4
+        self._powerup_start = self._brick_start + self.max_bricks * 3
+        self._ball_block = self._obs[6:self._ball_end].reshape(self.max_balls, 6)
+        self._brick_block = self._obs[self._brick_start:self._powerup_start].reshape(self.max_bricks, 3)
+        self._powerup_block = self._obs[self._powerup_start:].reshape(self.max_powerups, 3)
+        self._ball_state = np.zeros((self.max_balls, 4))  # x, y, vx, vy; grows with ball count
+        # Brick centres/types cached per brick list; only moving bricks are re-read each step
+        self._brick_list = None
+        self._brick_count = -1
+        self._brick_xy = np.zeros((0, 2))
+        self._brick_types = np.zeros(0, dtype=np.float32)
+        self._moving_bricks = []
+
+        if self.obs_mode == "grid":
+            self._setup_grid_obs()
+        elif self.obs_mode == "compact":
+            self._compact_layout = compact_layout(self.max_balls, self.max_bricks, self.max_powerups)
+            coord_idx, small_idx = self._compact_layout[:2]
+            self.observation_space = gym.spaces.Dict({
+                "coords": gym.spaces.Box(-1000, 2000, (len(coord_idx),), dtype=np.int16),
+                "small": gym.spaces.Box(-128, 127, (len(small_idx),), dtype=np.int8),
+            })
+
+        # Training runs never touch SDL; only the windowed mode loads pygame
+        self.screen = None
+        self.atlas = None
+        if not self.rl_mode:
+            import pygame
+            from sprite_atlas import SpriteAtlas
+            pygame.init()
             self.screen = pygame.display.set_mode((GAME_WIDTH, SCREEN_HEIGHT))
-        self.clock = pygame.time.Clock()
+            self.atlas = SpriteAtlas()  # Ball trails and glows are blitted from here
 
         self._setup_game()
 
+    def _setup_grid_obs(self):
+        grid_shape = (BRICK_ROWS, BRICK_COLS)
+        self.observation_space = gym.spaces.Dict({
+            # 0 = empty cell, 255 = unbreakable
+            "brick_hits": gym.spaces.Box(0, 255, grid_shape, dtype=np.uint8),
+            # Brick.type, 0 = empty cell
+            "brick_types": gym.spaces.Box(0, 255, grid_shape, dtype=np.uint8),
+            # player_x, ai_x, player_width, ai_width
+            "paddles": gym.spaces.Box(0, GAME_WIDTH, (4,), dtype=np.float32),
+            # Per ball: x, y, vx, vy, present
+            "balls": gym.spaces.Box(-1000, 2000, (self.max_balls, 5), dtype=np.float32),
+            # Per off-lattice brick: x, y, hits (-1 unbreakable), type (0 = none)
+            "extra_bricks": gym.spaces.Box(-1, 2000, (MAX_EXTRA_BRICKS, 4), dtype=np.float32),
+            # Per power-up: x, y, type (-1 = none); y is negative once one leaves the top
+            "powerups": gym.spaces.Box(-1000, 2000, (self.max_powerups, 3), dtype=np.float32),
+        })
+        self._brick_hits = np.zeros(grid_shape, dtype=np.uint8)
+        self._brick_type_grid = np.zeros(grid_shape, dtype=np.uint8)
+        self._grid_list = None  # Brick list the grids were built from
+        self._grid_cell = {}    # lattice brick -> (row, col)
+
     def _setup_game(self):
-        # Create paddles
-        self.player_paddle = Paddle((GAME_WIDTH - PADDLE_WIDTH) // 2, SCREEN_HEIGHT - 60)
-        self.ai_paddle = AIPaddle((GAME_WIDTH - PADDLE_WIDTH) // 2, 40)
+        # Each env owns its own simulation, so several can share a process
+        self.game = GameCore(level=1, level_cache=shared_level_cache(self.level_pack))
+        self.player_paddle = self.game.player_paddle
+        self.ai_paddle = self.game.ai_paddle
         self.level = 1
-        self.score = 0
         self.done = False
         self.reset()
 
+    @property
+    def balls(self):
+        return self.game.balls
+
+    @property
+    def bricks(self):
+        return self.game.bricks
+
+    @property
+    def power_ups(self):
+        return self.game.power_ups
+
+    @property
+    def score(self):
+        return self.game.score
+
+    @property
+    def player_balls_lost(self):
+        return self.game.player_balls_lost
+
+    @property
+    def ai_balls_lost(self):
+        return self.game.ai_balls_lost
+
+    @property
+    def player_bricks_broken(self):
+        return self.game.ledger.player.bricks_broken
+
+    @property
+    def ai_bricks_broken(self):
+        return self.game.ledger.ai.bricks_broken
+
     def reset(self, *, seed=None, options=None):
         super().reset(seed=seed)
-        # Reset the game state using your game's reset_level function
-        reset_level(self.player_paddle, self.ai_paddle, self.level)
-        # Sync global state to local
-        from multi_brick import balls, bricks, player_balls_lost, ai_balls_lost
-        self.balls = balls
-        self.bricks = bricks
-        self.player_balls_lost = player_balls_lost
-        self.ai_balls_lost = ai_balls_lost
-        self.player_bricks_broken = 0
-        self.ai_bricks_broken = 0
+        self.game.score = 0
+        # Seeded layouts come from the level cache; otherwise create_bricks draws a fresh one
+        layout_seed = None
+        if self.layout_seeds is not None:
+            layout_seed = int(self.np_random.integers(self.layout_seeds))
+        self.game.reset_level(self.level, layout_seed)
+        self.no_move_steps = 0
         self.done = False
         obs = self._get_obs()
-        info = {}  # Optionally add info
+        info = {"layout_seed": layout_seed}
         return obs, info
 
     def step(self, action):
+        action = int(action)
+        reward = 0.0
+        terminated = False
+        # Frame-skip: repeat the action for several ticks, stopping early once the episode ends
+        for _ in range(self.action_repeat):
+            reward += self._tick(action)
+            terminated = self._terminated()
+            if terminated:
+                break
+
+        truncated = False
+        info = {
+            "winner": "agent" if len(self.bricks) == 0 else "env",
+            "balls_left": len(self.balls),
+            "bricks_left": len(self.bricks),
+            "player_balls_lost": self.player_balls_lost,
+        }
+        return self._get_obs(), reward, terminated, truncated, info
+
+    def _terminated(self):
+        return bool(self.game.round_over) or self.player_balls_lost >= 5 or self.done
+
+    def _tick(self, action):
+        """Advance the simulation one tick and return the shaped reward for it."""
         prev_x = self.player_paddle.rect.centerx
         reward = 0.0  # Initialize reward FIRST
-        
-        # Move paddle
-        if action == 1:
-            self.player_paddle.move(-PADDLE_SPEED)
-        elif action == 2:
-            self.player_paddle.move(PADDLE_SPEED)
+        player = self.game.ledger.player
+        bricks_before, balls_lost_before = player.bricks_broken, player.balls_lost
+
+        events = self.game.step(action)
+        if self.obs_mode == "grid":
+            self._apply_brick_events(events)
 
         # Add movement incentive
         if abs(prev_x - self.player_paddle.rect.centerx) > 0:
             reward += 0.05  # Stronger incentive to move
 
-        self.ai_paddle.update(self.balls)
-
         # Penalize hugging the wall
         if self.player_paddle.rect.left <= 0 or self.player_paddle.rect.right >= GAME_WIDTH:
             reward -= 0.01
 
         # Encourage movement
-        if not hasattr(self, "no_move_steps"):
-            self.no_move_steps = 0
         if self.player_paddle.rect.centerx != prev_x:
             reward += 0.01
             self.no_move_steps = 0
@@ -111,138 +272,167 @@ class BrickPongEnv(gym.Env):
             if self.no_move_steps >= 10:
                 reward -= 0.05  # Penalize standing still
 
-        # Track bricks broken this step
-        bricks_broken_this_step = 0
-
-        for ball in self.balls[:]:
-            ball.update()
-            # Ball lost (bottom)
-            if ball.rect.bottom >= SCREEN_HEIGHT:
-                self.player_balls_lost += 1
-                self.balls.remove(ball)
-                reward -= 10.0
-                continue
-
-            # Ball lost (top)
-            elif ball.rect.top <= 0:
-                self.ai_balls_lost += 1
-                self.balls.remove(ball)
-                continue
-
-            # Paddle collision (player)
-            if ball.rect.colliderect(self.player_paddle.rect) and ball.vy > 0:
-                ball.vy = -abs(ball.vy)
-                offset = (ball.rect.centerx - self.player_paddle.rect.centerx) / (self.player_paddle.rect.width / 2)
-                ball.vx = 5 * offset * 1.5
-                ball.rect.bottom = self.player_paddle.rect.top
-                ball.last_hit_by = "player"
-                reward += 0.1
-                reward += 0.5  # Bigger reward for hitting the ball
-
-            # Paddle collision (AI)
-            if ball.rect.colliderect(self.ai_paddle.rect) and ball.vy < 0:
-                ball.vy = abs(ball.vy)
-                offset = (ball.rect.centerx - self.ai_paddle.rect.centerx) / (self.ai_paddle.rect.width / 2)
-                ball.vx = 5 * offset * 1.5
-                ball.rect.top = self.ai_paddle.rect.bottom
-                ball.last_hit_by = "ai"
-
-            # Brick collision
-            for brick in self.bricks[:]:
-                if ball.rect.colliderect(brick.rect):
-                    if brick.hit():
-                        self.bricks.remove(brick)
-                        if ball.last_hit_by == "player":
-                            reward += 1.0
-                            bricks_broken_this_step += 1
-                    ball.vy = -ball.vy
-                    break
+        for _ in range(events.count(EVENT_PADDLE_HIT, SIDE_PLAYER)):
+            reward += 0.1
+            reward += 0.5  # Bigger reward for hitting the ball
+
+        # Bricks and balls come straight from the ledger's running totals
+        bricks_broken_this_step = player.bricks_broken - bricks_before
+        reward += 1.0 * bricks_broken_this_step
+        reward -= 10.0 * (player.balls_lost - balls_lost_before)
 
         # Bonus for breaking multiple bricks in one step
         if bricks_broken_this_step > 1:
             reward += 0.5 * (bricks_broken_this_step - 1)
 
-        terminated = len(self.balls) == 0 or len(self.bricks) == 0 or self.player_balls_lost >= 5 or getattr(self, "done", False)
-        truncated = False
-        info = {
-            "winner": "agent" if len(self.bricks) == 0 else "env",
-            "balls_left": len(self.balls),
-            "bricks_left": len(self.bricks),
-            "player_balls_lost": self.player_balls_lost,
+        return reward
+
+    def _brick_centres(self):
+        """(n, 2) array of brick centres, rebuilt only when the brick list changes."""
+        bricks = self.bricks
+        if bricks is not self._brick_list or len(bricks) != self._brick_count:
+            self._brick_list = bricks
+            self._brick_count = len(bricks)
+            self._brick_xy = np.array([brick.rect.center for brick in bricks], dtype=np.float64).reshape(-1, 2)
+            self._brick_types = np.array([getattr(brick, "type", -1) for brick in bricks], dtype=np.float32)
+            self._moving_bricks = [(i, brick) for i, brick in enumerate(bricks) if brick.type == 5]
+        for i, brick in self._moving_bricks:
+            self._brick_xy[i] = brick.rect.center
+        return self._brick_xy
+
+    def _rebuild_brick_grid(self):
+        """Fill the brick grids from scratch; only needed when the brick list is replaced."""
+        bricks = self.bricks
+        self._grid_list = bricks
+        self._grid_cell = {}
+        self._brick_hits[:] = 0
+        self._brick_type_grid[:] = 0
+        cell_of = self.game.brick_grid.cell_of
+        for brick in bricks:
+            cell = cell_of.get(brick)
+            if cell is None:
+                continue  # Off-lattice, reported in extra_bricks
+            row, col = divmod(cell, BRICK_COLS)
+            self._grid_cell[brick] = (row, col)
+            self._brick_hits[row, col] = _hits_code(brick.hits)
+            self._brick_type_grid[row, col] = brick.type
+
+    def _apply_brick_events(self, events):
+        """Patch the brick grids for the bricks damaged or destroyed this tick."""
+        kinds, subjects = events.kind, events.subject
+        for i in events.slots():
+            kind = kinds[i]
+            if kind == EVENT_BRICK_HIT:
+                cell = self._grid_cell.get(subjects[i])
+                if cell is not None:
+                    self._brick_hits[cell] = _hits_code(subjects[i].hits)
+            elif kind == EVENT_BRICK_BROKEN:
+                cell = self._grid_cell.pop(subjects[i], None)
+                if cell is not None:
+                    self._brick_hits[cell] = 0
+                    self._brick_type_grid[cell] = 0
+
+    def _get_grid_obs(self):
+        if self.bricks is not self._grid_list:
+            self._rebuild_brick_grid()  # New level or reset
+
+        player = self.player_paddle.rect
+        ai = self.ai_paddle.rect
+        paddles = np.array([player.centerx, ai.centerx, player.width, ai.width], dtype=np.float32)
+
+        balls = np.zeros((self.max_balls, 5), dtype=np.float32)
+        for i, b in enumerate(self.balls[:self.max_balls]):
+            balls[i] = (b.rect.centerx, b.rect.centery, b.vx, b.vy, 1)
+
+        extra = np.zeros((MAX_EXTRA_BRICKS, 4), dtype=np.float32)
+        for i, brick in enumerate(self.game.brick_grid.overflow[:MAX_EXTRA_BRICKS]):
+            extra[i] = (brick.rect.centerx, brick.rect.centery, brick.hits, brick.type)
+
+        powerups = np.full((self.max_powerups, 3), -1, dtype=np.float32)
+        powerups[:, :2] = 0
+        for i, pu in enumerate(self.power_ups[:self.max_powerups]):
+            powerups[i] = (pu.rect.centerx, pu.rect.centery, POWERUP_TYPE_INDEX.get(pu.type, -1))
+
+        return {
+            "brick_hits": self._brick_hits.copy(),
+            "brick_types": self._brick_type_grid.copy(),
+            "paddles": paddles,
+            "balls": balls,
+            "extra_bricks": extra,
+            "powerups": powerups,
         }
-        return self._get_obs(), reward, terminated, truncated, info
 
     def _get_obs(self):
-        obs = []
+        if self.obs_mode == "grid":
+            return self._get_grid_obs()
+        obs = self._fill_vector_obs()
+        if self.obs_mode == "compact":
+            coord_idx, small_idx, small_scale, _ = self._compact_layout
+            return {
+                "coords": np.rint(obs[coord_idx]).astype(np.int16),
+                "small": np.clip(np.rint(obs[small_idx] * small_scale), -128, 127).astype(np.int8),
+            }
+        # Callers keep earlier observations (SB3 terminal obs, replay buffers), so hand out a copy
+        return obs.copy()
+
+    def _fill_vector_obs(self):
+        obs = self._obs
+        player = self.player_paddle.rect
+        ai = self.ai_paddle.rect
         # Paddle positions and edges
-        obs.extend([
-            self.player_paddle.rect.centerx,
-            self.ai_paddle.rect.centerx,
-            self.player_paddle.rect.left,
-            self.player_paddle.rect.right,
-            self.ai_paddle.rect.left,
-            self.ai_paddle.rect.right,
-        ])
-        # Balls
-        for i in range(self.max_balls):
-            if i < len(self.balls):
-                b = self.balls[i]
-                # Distance to player paddle center
-                dist_to_paddle = np.linalg.norm([
-                    b.rect.centerx - self.player_paddle.rect.centerx,
-                    b.rect.centery - self.player_paddle.rect.centery
-                ])
-                # Distance to nearest brick
-                if self.bricks:
-                    dists = [np.linalg.norm([
-                        b.rect.centerx - brick.rect.centerx,
-                        b.rect.centery - brick.rect.centery
-                    ]) for brick in self.bricks]
-                    dist_to_brick = min(dists)
-                else:
-                    dist_to_brick = 0
-                obs.extend([
-                    b.rect.centerx, b.rect.centery, b.vx, b.vy,
-                    dist_to_paddle, dist_to_brick
-                ])
-            else:
-                obs.extend([0, 0, 0, 0, 0, 0])
-        # Closest ball dx/dy
-        closest_ball_dx = 0
-        closest_ball_dy = 0
-        min_dist = float("inf")
-        for b in self.balls:
-            dx = b.rect.centerx - self.player_paddle.rect.centerx
-            dy = b.rect.centery - self.player_paddle.rect.centery
-            dist = abs(dx) + abs(dy)
-            if dist < min_dist:
-                min_dist = dist
-                closest_ball_dx = dx
-                closest_ball_dy = dy
-        obs.extend([closest_ball_dx, closest_ball_dy])
-        # Balls left, bricks left
-        obs.append(len(self.balls))
-        obs.append(len(self.bricks))
+        obs[0:6] = (player.centerx, ai.centerx, player.left, player.right, ai.left, ai.right)
+
+        # Ball state for every ball; the closest-ball term also looks past max_balls
+        balls = self.balls
+        count = len(balls)
+        if count > len(self._ball_state):
+            self._ball_state = np.zeros((count, 4))
+        state = self._ball_state[:count]
+        for i, b in enumerate(balls):
+            state[i] = (b.rect.centerx, b.rect.centery, b.vx, b.vy)
+        dx = state[:, 0] - player.centerx
+        dy = state[:, 1] - player.centery
+
+        # Balls: x, y, vx, vy, distance to paddle, distance to nearest brick
+        centres = self._brick_centres()
+        shown = min(count, self.max_balls)
+        block = self._ball_block
+        block[:] = 0
+        block[:shown, :4] = state[:shown]
+        block[:shown, 4] = np.sqrt(dx[:shown] ** 2 + dy[:shown] ** 2)
+        if shown and len(centres):
+            # Every ball-to-brick distance in one batched call
+            diff = state[:shown, None, :2] - centres[None, :, :]
+            block[:shown, 5] = np.sqrt((diff ** 2).sum(axis=2).min(axis=1))
+
+        # Closest ball dx/dy (Manhattan distance), balls left, bricks left
+        end = self._ball_end
+        if count:
+            closest = np.argmin(np.abs(dx) + np.abs(dy))
+            obs[end] = dx[closest]
+            obs[end + 1] = dy[closest]
+        else:
+            obs[end] = obs[end + 1] = 0
+        obs[end + 2] = count
+        obs[end + 3] = len(centres)
+
         # Bricks info (pad to max_bricks)
-        for i in range(self.max_bricks):
-            if i < len(self.bricks):
-                brick = self.bricks[i]
-                obs.extend([brick.rect.centerx, brick.rect.centery, getattr(brick, "type", -1)])
-            else:
-                obs.extend([0, 0, -1])
-        # Powerups info (already padded in original)
-        powerup_type_map = {"speed": 0, "size": 1, "multi": 2, "score": 3, "laser": 4, "slow": 5}
-        powerups = getattr(self, "power_ups", [])
-        for i in range(self.max_powerups):
-            if i < len(powerups):
-                pu = powerups[i]
-                obs.extend([pu.rect.centerx, pu.rect.centery, powerup_type_map.get(pu.type, -1)])
-            else:
-                obs.extend([0, 0, -1])
-        return np.array(obs, dtype=np.float32)
+        shown = min(len(centres), self.max_bricks)
+        block = self._brick_block
+        block[shown:] = (0, 0, -1)
+        block[:shown, :2] = centres[:shown]
+        block[:shown, 2] = self._brick_types[:shown]
+
+        # Powerups info
+        block = self._powerup_block
+        block[:] = (0, 0, -1)
+        for i, pu in enumerate(self.power_ups[:self.max_powerups]):
+            block[i] = (pu.rect.centerx, pu.rect.centery, POWERUP_TYPE_INDEX.get(pu.type, -1))
+        return obs
 
     def render(self, mode="human"):
         if not self.rl_mode:
+            import pygame
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.done = True
@@ -277,29 +467,21 @@ class BrickPongEnv(gym.Env):
                 if hasattr(brick, "special") and brick.special:
                     pygame.draw.rect(self.screen, (255, 255, 0), brick.rect, 2)
 
-            # Draw balls with trail effect
+            # Draw balls with trail effect: pre-rendered atlas sprites, blitted in one batch
+            atlas = self.atlas
+            glow = atlas.glow(100)
+            sprites = []
             for ball in self.balls:
                 # Draw trail
                 if hasattr(ball, "trail") and ball.trail:
                     for i, trail_pos in enumerate(ball.trail[-3:][::-1]):
                         trail_radius = max(1, ball.rect.width // 2 - i)
-                        alpha = 255 - i * 60
-                        trail_color = (255, 255, 255, alpha)
-                        trail_surface = pygame.Surface((trail_radius*2, trail_radius*2), pygame.SRCALPHA)
-                        pygame.draw.circle(trail_surface, trail_color, (trail_radius, trail_radius), trail_radius)
-                        self.screen.blit(trail_surface, (trail_pos[0] - trail_radius, trail_pos[1] - trail_radius))
-                # Draw main ball
-                pygame.draw.ellipse(self.screen, (255, 255, 255), ball.rect)
-                # Ball glow
-                glow_rect = pygame.Rect(
-                    ball.rect.x - 3,
-                    ball.rect.y - 3,
-                    ball.rect.width + 6,
-                    ball.rect.height + 6
-                )
-                glow_surface = pygame.Surface((glow_rect.width, glow_rect.height), pygame.SRCALPHA)
-                pygame.draw.ellipse(glow_surface, (200, 200, 255, 100), glow_surface.get_rect(), 2)
-                self.screen.blit(glow_surface, (glow_rect.x, glow_rect.y))
+                        trail = atlas.trail(trail_radius, 255 - i * 60)
+                        sprites.append((trail, (trail_pos[0] - trail_radius, trail_pos[1] - trail_radius)))
+                # Main ball and its glow
+                sprites.append((atlas.ball, (ball.rect.x, ball.rect.y)))
+                sprites.append((glow, (ball.rect.x - 3, ball.rect.y - 3)))
+            self.screen.blits(sprites, False)
 
             # Draw side panel with metrics (if you have a function for this)
             if "draw_side_panel" in globals():
@@ -315,4 +497,51 @@ class BrickPongEnv(gym.Env):
             pygame.display.flip()
 
     def close(self):
-        pygame.quit()
\ No newline at end of file
+        if self.screen is not None:
+            import pygame
+            pygame.quit()
+
+class CompactObsDecoder(gym.ObservationWrapper):
+    """Turns obs_mode="compact" observations back into the float32 vector layout."""
+
+    def __init__(self, env):
+        super().__init__(env)
+        base = env.unwrapped
+        self._layout = compact_layout(base.max_balls, base.max_bricks, base.max_powerups)
+        obs_len = self._layout[3]
+        self.observation_space = gym.spaces.Box(np.full(obs_len, -1000, dtype=np.float32),
+                                                np.full(obs_len, 2000, dtype=np.float32), dtype=np.float32)
+
+    def observation(self, obs):
+        return decode_compact_obs(obs, self._layout)
+
+def benchmark_compact_obs(steps=20_000, buffer_size=1_000_000):
+    """Replay-buffer memory and env steps/sec of obs_mode="compact" versus the float32 vector."""
+    import random
+    import time
+    from stable_baselines3.common.buffers import DictReplayBuffer, ReplayBuffer
+
+    for mode, buffer_class in (("vector", ReplayBuffer), ("compact", DictReplayBuffer)):
+        env = BrickPongEnv(obs_mode=mode)
+        buffer = buffer_class(buffer_size, env.observation_space, env.action_space)
+        if mode == "vector":
+            obs_bytes = buffer.observations.nbytes + buffer.next_observations.nbytes
+        else:
+            obs_bytes = sum(a.nbytes for a in buffer.observations.values()) + \
+                sum(a.nbytes for a in buffer.next_observations.values())
+
+        # Same seeds for both modes so they simulate the same matches
+        random.seed(0)
+        actions = np.random.default_rng(0).integers(0, 3, size=steps)
+        env.reset(seed=0)
+        start = time.perf_counter()
+        for action in actions:
+            _, _, terminated, _, _ = env.step(action)
+            if terminated:
+                env.reset()
+        sps = steps / (time.perf_counter() - start)
+        print(f"{mode:8s} {obs_bytes / buffer_size:6.0f} obs bytes/transition "
+              f"({obs_bytes / 2**20:7,.0f} MiB for {buffer_size:,}), {sps:8,.0f} steps/s")
+
+if __name__ == "__main__":
+    benchmark_compact_obs()
@@ -0,0 +1,135 @@
+import json
+import os
+
+import numpy as np
+from stable_baselines3.common.buffers import BaseBuffer, ReplayBuffer
+
+# Arrays kept on disk, one .npy file each
+BUFFER_ARRAYS = ("observations", "next_observations", "actions", "rewards", "dones", "timeouts")
+STATE_FILE = "state.json"
+
+class MemmapReplayBuffer(ReplayBuffer):
+    """
+    SB3 ReplayBuffer whose arrays are memory-mapped .npy files in `path`.
+
+    Only the pages being written or sampled are held in RAM, so the buffer
+    size is bounded by disk rather than memory: a 10M-transition buffer of
+    BrickPongEnv vector observations is ~9.4 GB on disk. The write position
+    is saved to state.json every `flush_every` transitions and on flush(), so
+    a new buffer opened on the same path (e.g. after a crash) carries on
+    from there.
+    Use it with
+        DQN(..., replay_buffer_class=MemmapReplayBuffer,
+            replay_buffer_kwargs={"path": "rl_models/DQN_replay"})
+    Only Box/Discrete observation spaces are supported (not Dict).
+    """
+
+    def __init__(self, buffer_size, observation_space, action_space, device="auto", n_envs=1,
+                 optimize_memory_usage=False, handle_timeout_termination=True,
+                 path="replay_buffer", resume=True, flush_every=10_000):
+        # Skip ReplayBuffer.__init__, which would allocate every array in RAM
+        BaseBuffer.__init__(self, buffer_size, observation_space, action_space, device, n_envs=n_envs)
+        self.buffer_size = max(buffer_size // n_envs, 1)
+        if optimize_memory_usage and handle_timeout_termination:
+            raise ValueError(
+                "ReplayBuffer does not support optimize_memory_usage = True "
+                "and handle_timeout_termination = True simultaneously."
+            )
+        self.optimize_memory_usage = optimize_memory_usage
+        self.handle_timeout_termination = handle_timeout_termination
+        self.path = path
+        self.flush_every = flush_every
+        self._adds_since_flush = 0
+        self._open(resume)
+
+    def _layout(self):
+        """Shape and dtype of every array file, also used to check a resumed buffer matches."""
+        rows = (self.buffer_size, self.n_envs)
+        obs_dtype = np.dtype(self.observation_space.dtype).str
+        layout = {
+            "observations": (rows + tuple(self.obs_shape), obs_dtype),
+            "next_observations": (rows + tuple(self.obs_shape), obs_dtype),
+            "actions": (rows + (self.action_dim,), np.dtype(self._maybe_cast_dtype(self.action_space.dtype)).str),
+            "rewards": (rows, np.dtype(np.float32).str),
+            "dones": (rows, np.dtype(np.float32).str),
+            "timeouts": (rows, np.dtype(np.float32).str),
+        }
+        if self.optimize_memory_usage:
+            del layout["next_observations"]  # `observations` also holds the next observation
+        return layout
+
+    def _open(self, resume):
+        os.makedirs(self.path, exist_ok=True)
+        layout = self._layout()
+        state = None
+        state_path = os.path.join(self.path, STATE_FILE)
+        if resume and os.path.exists(state_path):
+            with open(state_path) as f:
+                state = json.load(f)
+            saved = {name: (tuple(shape), dtype) for name, (shape, dtype) in state["layout"].items()}
+            if saved != layout:
+                raise ValueError(f"Replay buffer in {self.path!r} has a different layout; "
+                                 "pass resume=False to overwrite it")
+
+        mode = "r+" if state is not None else "w+"
+        for name in BUFFER_ARRAYS:
+            if name in layout:
+                shape, dtype = layout[name]
+                array = np.lib.format.open_memmap(os.path.join(self.path, name + ".npy"),
+                                                  mode=mode, dtype=dtype, shape=shape)
+                setattr(self, name, array)
+
+        if state is not None:
+            self.pos = state["pos"]
+            self.full = state["full"]
+        else:
+            self.flush()
+
+    def flush(self):
+        """Write dirty pages to disk, then record the write position."""
+        for name in self._layout():
+            getattr(self, name).flush()
+        state = {
+            "pos": self.pos,
+            "full": self.full,
+            "layout": {name: [list(shape), dtype] for name, (shape, dtype) in self._layout().items()},
+        }
+        # Write-then-rename so a crash never leaves a half-written state file
+        state_path = os.path.join(self.path, STATE_FILE)
+        with open(state_path + ".tmp", "w") as f:
+            json.dump(state, f)
+        os.replace(state_path + ".tmp", state_path)
+        self._adds_since_flush = 0
+
+    def add(self, obs, next_obs, action, reward, done, infos):
+        super().add(obs, next_obs, action, reward, done, infos)
+        self._adds_since_flush += 1
+        if self._adds_since_flush >= self.flush_every:
+            self.flush()
+
+    def reset(self):
+        super().reset()
+        self.flush()
+
+    def sample(self, batch_size, env=None):
+        if self.optimize_memory_usage:
+            return super().sample(batch_size, env=env)
+        # Uniform indices, sorted so one fancy-indexing read walks each file front to back
+        upper = self.buffer_size if self.full else self.pos
+        batch_inds = np.sort(np.random.randint(0, upper, size=batch_size))
+        return self._get_samples(batch_inds, env=env)
+
+    # model.save_replay_buffer() pickles the buffer: keep the pickle to the path
+    # and write position, and reopen the files on load
+    def __getstate__(self):
+        self.flush()
+        state = self.__dict__.copy()
+        for name in BUFFER_ARRAYS:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        pos, full = self.pos, self.full
+        self._open(resume=True)
+        self.pos, self.full = pos, full
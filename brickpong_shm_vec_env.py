@@ -0,0 +1,299 @@
+import multiprocessing as mp
+import os
+import traceback
+from multiprocessing import shared_memory
+from threading import BrokenBarrierError
+
+import numpy as np
+from stable_baselines3.common.vec_env import VecEnv
+
+from brickpong_gym_env import BrickPongEnv
+
+# Command slot values; workers read the slot after the barrier that starts a round
+CMD_STEP, CMD_RESET, CMD_CALL, CMD_CLOSE = range(4)
+
+def _shared_layout(num_envs, obs_len):
+    """(name, shape, dtype) of every array in the shared block."""
+    n = num_envs
+    return [
+        ("command", (1,), np.int32),
+        ("actions", (n,), np.int64),
+        ("seeds", (n,), np.int64),          # -1 = reset without a seed
+        ("obs", (n, obs_len), np.float32),
+        ("terminal_obs", (n, obs_len), np.float32),
+        ("rewards", (n,), np.float32),
+        ("dones", (n,), np.bool_),
+        ("truncated", (n,), np.bool_),
+        # Info fields reported for finished episodes
+        ("winner", (n,), np.bool_),
+        ("balls_left", (n,), np.int32),
+        ("bricks_left", (n,), np.int32),
+        ("player_balls_lost", (n,), np.int32),
+    ]
+
+def _shared_size(layout):
+    size = 0
+    for _, shape, dtype in layout:
+        size += -(-int(np.prod(shape)) * np.dtype(dtype).itemsize // 8) * 8  # Keep 8-byte alignment
+    return size
+
+def _shared_views(buf, layout):
+    """NumPy views onto the shared block, keyed by name."""
+    views = {}
+    offset = 0
+    for name, shape, dtype in layout:
+        count = int(np.prod(shape))
+        views[name] = np.ndarray(shape, dtype=dtype, buffer=buf, offset=offset)
+        offset += -(-count * np.dtype(dtype).itemsize // 8) * 8
+    return views
+
+def _handle_request(envs, request, local):
+    """Attribute access / method calls forwarded over the worker's pipe."""
+    kind, name, args, kwargs = request
+    if kind == "get":
+        return [getattr(envs[i], name) for i in local]
+    if kind == "set":
+        for i in local:
+            setattr(envs[i], name, args[0])
+        return [None] * len(local)
+    return [getattr(envs[i], name)(*args, **kwargs) for i in local]
+
+def _worker(shm, layout, start, stop, env_kwargs, barrier, pipe, cpu):
+    """Own envs [start, stop) and step them each time the barrier releases a round."""
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpu})
+    if isinstance(shm, str):
+        shm = shared_memory.SharedMemory(name=shm)
+    arrays = _shared_views(shm.buf, layout)
+    command = arrays["command"]
+    envs = [BrickPongEnv(**env_kwargs) for _ in range(start, stop)]
+    try:
+        while True:
+            barrier.wait()
+            cmd = command[0]
+            if cmd == CMD_CLOSE:
+                break
+            if cmd == CMD_STEP:
+                actions = arrays["actions"]
+                for i, env in enumerate(envs, start):
+                    obs, reward, terminated, truncated, info = env.step(actions[i])
+                    done = terminated or truncated
+                    if done:
+                        arrays["terminal_obs"][i] = obs
+                        arrays["truncated"][i] = truncated and not terminated
+                        arrays["winner"][i] = info["winner"] == "agent"
+                        arrays["balls_left"][i] = info["balls_left"]
+                        arrays["bricks_left"][i] = info["bricks_left"]
+                        arrays["player_balls_lost"][i] = info["player_balls_lost"]
+                        obs, _ = env.reset()
+                    arrays["obs"][i] = obs
+                    arrays["rewards"][i] = reward
+                    arrays["dones"][i] = done
+            elif cmd == CMD_RESET:
+                seeds = arrays["seeds"]
+                for i, env in enumerate(envs, start):
+                    seed = int(seeds[i])
+                    arrays["obs"][i], _ = env.reset(seed=None if seed < 0 else seed)
+            elif cmd == CMD_CALL:
+                request, local = pipe.recv()
+                try:
+                    pipe.send((True, _handle_request(envs, request, local) if local else []))
+                except Exception as exc:
+                    pipe.send((False, exc))  # Raised again in the main process
+            barrier.wait()
+    except BrokenBarrierError:
+        pass  # The main process closed or another worker failed
+    except Exception:
+        traceback.print_exc()
+        barrier.abort()
+    finally:
+        for env in envs:
+            env.close()
+        del arrays, command
+        shm.close()
+
+class SharedMemoryVecEnv(VecEnv):
+    """
+    BrickPongEnv instances spread over worker processes that share one memory block.
+
+    Workers write observations, rewards, dones and the finished-episode info
+    straight into shared NumPy arrays, so a step only costs the caller two
+    barrier waits; nothing is pickled. Each worker steps a contiguous slice of
+    the envs, so give every worker several envs (e.g. num_envs = 4 x cores)
+    to keep the barrier cost small next to the simulation. step_async starts
+    the workers and returns; step_wait waits for them.
+
+    Finished episodes are reset automatically, like BrickPongVecEnv; info for
+    them carries terminal_observation, TimeLimit.truncated, winner,
+    balls_left, bricks_left and player_balls_lost. Only obs_mode="vector" is
+    supported. The default "fork" start method also works from scripts with
+    no `if __name__ == "__main__"` guard; with "spawn" the guard is required.
+    """
+
+    def __init__(self, num_envs=32, n_workers=None, env_kwargs=None, start_method=None, pin_workers=False):
+        self.env_kwargs = dict(env_kwargs or {})
+        if self.env_kwargs.get("obs_mode", "vector") != "vector":
+            raise ValueError("SharedMemoryVecEnv only supports obs_mode='vector'")
+        probe = BrickPongEnv(**self.env_kwargs)
+        observation_space, action_space = probe.observation_space, probe.action_space
+        probe.close()
+        self.num_envs = num_envs
+
+        n_workers = min(num_envs, n_workers or os.cpu_count() or 1)
+        layout = _shared_layout(num_envs, observation_space.shape[0])
+        self._shm = shared_memory.SharedMemory(create=True, size=_shared_size(layout))
+        self._arrays = _shared_views(self._shm.buf, layout)
+        self._arrays["seeds"][:] = -1
+
+        if start_method is None:
+            start_method = "fork" if "fork" in mp.get_all_start_methods() else "spawn"
+        ctx = mp.get_context(start_method)
+        self._barrier = ctx.Barrier(n_workers + 1)
+        # Forked workers inherit the mapping; spawned ones attach by name
+        shm_arg = self._shm if start_method == "fork" else self._shm.name
+
+        self._slices = np.array_split(np.arange(num_envs), n_workers)
+        self._worker_of = np.zeros(num_envs, dtype=np.int64)
+        self._pipes = []
+        self._processes = []
+        cpus = sorted(os.sched_getaffinity(0)) if pin_workers and hasattr(os, "sched_getaffinity") else None
+        for w, envs in enumerate(self._slices):
+            self._worker_of[envs] = w
+            parent, child = ctx.Pipe()
+            cpu = cpus[w % len(cpus)] if cpus else None
+            process = ctx.Process(target=_worker, daemon=True,
+                                  args=(shm_arg, layout, int(envs[0]), int(envs[-1]) + 1,
+                                        self.env_kwargs, self._barrier, child, cpu))
+            process.start()
+            child.close()
+            self._pipes.append(parent)
+            self._processes.append(process)
+        self._waiting = False
+        self.closed = False
+        # Last, since VecEnv.__init__ already asks the workers for render_mode
+        super().__init__(num_envs, observation_space, action_space)
+
+    def _wait(self):
+        try:
+            self._barrier.wait()
+        except BrokenBarrierError:
+            raise RuntimeError("a SharedMemoryVecEnv worker failed; see its traceback above") from None
+
+    def _start(self, cmd):
+        self._arrays["command"][0] = cmd
+        self._wait()
+
+    # ---------------------------- VecEnv API ----------------------------
+    def reset(self):
+        seeds = self._arrays["seeds"]
+        seeds[:] = [-1 if seed is None else seed for seed in self._seeds]
+        self._start(CMD_RESET)
+        self._wait()
+        seeds[:] = -1
+        self._reset_seeds()
+        self._reset_options()
+        return self._arrays["obs"].copy()
+
+    def step_async(self, actions):
+        self._arrays["actions"][:] = np.asarray(actions).reshape(self.num_envs)
+        self._start(CMD_STEP)
+        self._waiting = True
+
+    def step_wait(self):
+        self._wait()
+        self._waiting = False
+        arrays = self._arrays
+        dones = arrays["dones"].copy()
+        infos = [{} for _ in range(self.num_envs)]
+        for env in np.nonzero(dones)[0]:
+            infos[env] = {
+                "terminal_observation": arrays["terminal_obs"][env].copy(),
+                "TimeLimit.truncated": bool(arrays["truncated"][env]),
+                "winner": "agent" if arrays["winner"][env] else "env",
+                "balls_left": int(arrays["balls_left"][env]),
+                "bricks_left": int(arrays["bricks_left"][env]),
+                "player_balls_lost": int(arrays["player_balls_lost"][env]),
+            }
+        return arrays["obs"].copy(), arrays["rewards"].copy(), dones, infos
+
+    def close(self):
+        if self.closed:
+            return
+        if self._waiting:
+            self._wait()
+        self._arrays["command"][0] = CMD_CLOSE
+        try:
+            self._barrier.wait()
+        except BrokenBarrierError:
+            pass  # A worker already failed; the rest exit on the broken barrier
+        for process in self._processes:
+            process.join()
+        for pipe in self._pipes:
+            pipe.close()
+        self._arrays = None  # Drop the views before releasing the block
+        self._shm.close()
+        self._shm.unlink()
+        self.closed = True
+
+    def _call(self, request, indices):
+        """Send a request to the workers owning `indices` and gather one result per env."""
+        indices = list(self._get_indices(indices))
+        local = [[] for _ in self._pipes]
+        for i in indices:
+            w = self._worker_of[i]
+            local[w].append(i - int(self._slices[w][0]))
+        for pipe, envs in zip(self._pipes, local):
+            pipe.send((request, envs))
+        self._start(CMD_CALL)
+        results = {}
+        error = None
+        for w, pipe in enumerate(self._pipes):
+            # Read before the closing barrier so a large reply can't block the worker
+            ok, reply = pipe.recv()
+            if not ok:
+                error = error or reply
+                continue
+            for i, result in zip(local[w], reply):
+                results[int(self._slices[w][0]) + i] = result
+        self._wait()
+        if error is not None:
+            raise error
+        return [results[i] for i in indices]
+
+    def get_attr(self, attr_name, indices=None):
+        return self._call(("get", attr_name, (), {}), indices)
+
+    def set_attr(self, attr_name, value, indices=None):
+        self._call(("set", attr_name, (value,), {}), indices)
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        return self._call(("call", method_name, method_args, method_kwargs), indices)
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return [False] * len(list(self._get_indices(indices)))
+
+def benchmark(num_envs=64, steps=500):
+    """Steps/sec of this env versus the DummyVecEnv(4 x BrickPongEnv) setup in rl_train_compare_v2.py."""
+    import time
+    from stable_baselines3.common.vec_env import DummyVecEnv
+
+    dummy = DummyVecEnv([BrickPongEnv for _ in range(4)])
+    dummy.reset()
+    start = time.perf_counter()
+    for _ in range(steps):
+        dummy.step(np.random.randint(0, 3, size=4))
+    dummy_sps = 4 * steps / (time.perf_counter() - start)
+    print(f"DummyVecEnv x4:              {dummy_sps:10,.0f} steps/s")
+
+    for n_workers in sorted({1, os.cpu_count() // 2 or 1, os.cpu_count()}):
+        env = SharedMemoryVecEnv(num_envs=num_envs, n_workers=n_workers, pin_workers=True)
+        env.reset()
+        start = time.perf_counter()
+        for _ in range(steps):
+            env.step(np.random.randint(0, 3, size=num_envs))
+        sps = num_envs * steps / (time.perf_counter() - start)
+        env.close()
+        print(f"SharedMemoryVecEnv x{num_envs}, {n_workers:2d} workers: {sps:10,.0f} steps/s ({sps / dummy_sps:.1f}x)")
+
+if __name__ == "__main__":
+    benchmark()
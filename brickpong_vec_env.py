@@ -0,0 +1,784 @@
+import numpy as np
+import gymnasium as gym
+from stable_baselines3.common.vec_env import VecEnv
+
+from game_core import (
+    GAME_WIDTH, SCREEN_HEIGHT, FPS,
+    PADDLE_WIDTH, PADDLE_HEIGHT, PADDLE_SPEED, BALL_RADIUS, INITIAL_BALL_SPEED, MAX_BALLS,
+    BRICK_ROWS, BRICK_COLS, BRICK_WIDTH, BRICK_HEIGHT, BRICK_GAP,
+    BALL_MULT_INTERVAL, LEVEL_ADVANCE_DELAY, MAX_IMPACTS_PER_STEP,
+    ACTION_LEFT, ACTION_RIGHT,
+)
+
+# ---------------------------- GEOMETRY ----------------------------
+BALL_SIZE = BALL_RADIUS * 2
+MAX_SPEED = INITIAL_BALL_SPEED * 2.5
+PLAYER_Y = SCREEN_HEIGHT - 60
+AI_Y = 40
+
+BRICK_OFFSET_X = (GAME_WIDTH - (BRICK_COLS * BRICK_WIDTH + (BRICK_COLS - 1) * BRICK_GAP)) // 2
+BRICK_OFFSET_Y = 100
+BRICK_PITCH_X = BRICK_WIDTH + BRICK_GAP
+BRICK_PITCH_Y = BRICK_HEIGHT + BRICK_GAP
+
+# Bricks are stored as one flat row per match: the BRICK_ROWS x BRICK_COLS lattice in
+# row-major order (the order create_bricks appends them) followed by one boss slot.
+LATTICE_CELLS = BRICK_ROWS * BRICK_COLS
+BOSS_CELL = LATTICE_CELLS
+NUM_CELLS = LATTICE_CELLS + 1
+
+_cols = np.tile(np.arange(BRICK_COLS), BRICK_ROWS)
+_rows = np.repeat(np.arange(BRICK_ROWS), BRICK_COLS)
+CELL_X = np.append(BRICK_OFFSET_X + _cols * BRICK_PITCH_X,
+                   BRICK_OFFSET_X + (BRICK_COLS // 2) * BRICK_PITCH_X).astype(np.float64)
+CELL_Y = np.append(BRICK_OFFSET_Y + _rows * BRICK_PITCH_Y,
+                   BRICK_OFFSET_Y + (BRICK_ROWS // 2) * BRICK_PITCH_Y).astype(np.float64)
+CELL_W = np.append(np.full(LATTICE_CELLS, BRICK_WIDTH), BRICK_WIDTH * 2).astype(np.float64)
+CELL_CX = CELL_X + CELL_W // 2
+CELL_CY = CELL_Y + BRICK_HEIGHT // 2
+CELL_CX_F32 = CELL_CX.astype(np.float32)
+CELL_CY_F32 = CELL_CY.astype(np.float32)
+
+# Hit points per brick type (see Brick.__init__); type 0 marks an empty cell
+BRICK_HITS = np.array([0, 1, 3, -1, 10, 2], dtype=np.int16)
+
+POWERUP_SIZE = 30
+NUM_POWERUP_TYPES = 6  # speed, size, multi, score, laser, slow (PowerUp.type order)
+PU_SPEED, PU_SIZE, PU_MULTI, PU_SCORE, PU_LASER, PU_SLOW = range(NUM_POWERUP_TYPES)
+LASER_WIDTH = 20
+
+PLAYER, AI = 0, 1
+
+# What a ball ran into: brick cells are 0..NUM_CELLS-1, the rest follow
+HIT_NONE = -1
+HIT_LEFT, HIT_RIGHT, HIT_AI_GOAL, HIT_PLAYER_GOAL, HIT_PLAYER_PADDLE, HIT_AI_PADDLE = \
+    range(NUM_CELLS, NUM_CELLS + 6)
+# Face of a brick a ball touched, as bits ("xy" is a corner)
+AXIS_X, AXIS_Y, AXIS_XY = 1, 2, 3
+
+def _round_coord(values):
+    """Round half away from zero, matching game_core.Rect."""
+    return np.trunc(values + np.copysign(0.5, values))
+
+def _overlaps(ax, ay, aw, ah, bx, by, bw, bh):
+    """Rect.colliderect on arrays."""
+    return (ax < bx + bw) & (bx < ax + aw) & (ay < by + bh) & (by < ay + ah)
+
+def _sweep_balls(x, y, vx, vy, ox, oy, ow, oh):
+    """game_core._sweep_box for balls on arrays: (t, axis bits, valid)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        near_x, far_x = (ox - x - BALL_SIZE) / vx, (ox + ow - x) / vx
+        near_y, far_y = (oy - y - BALL_SIZE) / vy, (oy + oh - y) / vy
+    still_x, still_y = vx == 0, vy == 0
+    tx0 = np.where(still_x, -np.inf, np.where(vx > 0, near_x, far_x))
+    tx1 = np.where(still_x, np.inf, np.where(vx > 0, far_x, near_x))
+    ty0 = np.where(still_y, -np.inf, np.where(vy > 0, near_y, far_y))
+    ty1 = np.where(still_y, np.inf, np.where(vy > 0, far_y, near_y))
+    t0 = np.maximum(tx0, ty0)
+    t1 = np.minimum(tx1, ty1)
+    valid = (t0 < t1) & (t1 > 0) & \
+        (~still_x | ((x + BALL_SIZE > ox) & (x < ox + ow))) & \
+        (~still_y | ((y + BALL_SIZE > oy) & (y < oy + oh)))
+    axis = np.where(tx0 == ty0, AXIS_XY, np.where(tx0 > ty0, AXIS_X, AXIS_Y))
+    return t0, axis, valid
+
+def random_layouts(level, count, rng):
+    """
+    Brick types for `count` matches at this level, shape (count, NUM_CELLS).
+    Same patterns and type weights as create_bricks, drawn with NumPy instead of
+    one random.choices call per brick.
+    """
+    rows = np.arange(BRICK_ROWS)[:, None]
+    cols = np.arange(BRICK_COLS)[None, :]
+    shape = (count, BRICK_ROWS, BRICK_COLS)
+    edge = (rows == 0) | (rows == BRICK_ROWS - 1) | (cols == 0) | (cols == BRICK_COLS - 1)
+
+    def pick(choices, weights):
+        weights = np.asarray(weights, dtype=np.float64)
+        return rng.choice(np.asarray(choices, dtype=np.int8), size=shape, p=weights / weights.sum())
+
+    layout_type = level % 5
+    if layout_type == 0:  # Standard pattern
+        present = rng.random(shape) < 0.85
+        weights = [max(50 - level * 5, 10), 30 + level * 2, 20 + level]
+        lattice = np.where(present, pick([1, 2, 3], weights), 0)
+    elif layout_type == 1:  # Checkerboard pattern
+        present = (rows + cols) % 2 == 0
+        lattice = np.where(edge, pick([1, 2], [70, 30]), pick([1, 2, 3], [50, 40, 10]))
+        lattice = np.where(present, lattice, 0)
+    elif layout_type == 2:  # Fortress pattern
+        entry = ((rows == 0) | (rows == BRICK_ROWS - 1)) & (cols == BRICK_COLS // 2) | \
+                ((cols == 0) | (cols == BRICK_COLS - 1)) & (rows == BRICK_ROWS // 2)
+        border = np.where(entry, 1, pick([1, 2, 3], [20, 60, 20]))
+        interior = np.where(rng.random(shape) < 0.6, pick([1, 2], [70, 30]), 0)
+        lattice = np.where(edge, border, interior)
+    elif layout_type == 3:  # Triangle pattern
+        present = (cols >= (BRICK_COLS - rows - 1) // 2) & (cols < (BRICK_COLS + rows + 1) // 2)
+        lattice = np.where(present, pick([1, 2, 3], [50, 30, 20]), 0)
+    else:  # Circular pattern
+        max_radius = min(BRICK_COLS, BRICK_ROWS) // 2
+        distance = np.sqrt((cols - BRICK_COLS // 2) ** 2 + (rows - BRICK_ROWS // 2) ** 2)
+        ring = np.select([distance <= max_radius / 3, distance <= max_radius * 2 / 3, distance <= max_radius],
+                         [3, 2, 1], 0)
+        lattice = np.broadcast_to(ring, shape)
+
+    types = np.zeros((count, NUM_CELLS), dtype=np.int8)
+    types[:, :LATTICE_CELLS] = lattice.reshape(count, LATTICE_CELLS)
+    if level > 3 and level % 3 == 0:
+        types[:, BOSS_CELL] = 4
+    return types
+
+class BrickPongVecEnv(VecEnv):
+    """
+    N Brick Pong matches stepped together in struct-of-arrays NumPy buffers.
+
+    Follows GameCore's rules (swept ball impacts on sub-pixel positions, heuristic
+    AI, brick damage, power-ups, ball multiplication, level-advance timer) and
+    BrickPongEnv's observation layout and reward shaping, so it can replace
+    DummyVecEnv([BrickPongEnv] * n) in the SB3 scripts; parity_check() compares
+    the two. Finished matches are reset automatically; the last observation is
+    in info["terminal_observation"].
+
+    Balls are processed slot by slot, so they still see each other's brick damage
+    in the same order as GameCore; every other operation runs across all matches
+    at once. Ball multiplication beyond max_balls slots is dropped.
+    """
+
+    def __init__(self, num_envs=256, level=1, max_balls=MAX_BALLS, max_powerup_slots=8, seed=None,
+                 action_repeat=1):
+        if action_repeat < 1:
+            raise ValueError("action_repeat must be at least 1")
+        self.level = level
+        self.action_repeat = int(action_repeat)  # Ticks per step, as in BrickPongEnv
+        self.max_balls = max_balls
+        self.max_powerup_slots = max_powerup_slots
+        self.max_powerups = 3  # Power-ups reported in the observation
+        self.max_bricks = 20   # Bricks reported in the observation
+        self.render_mode = None
+        self.rng = np.random.default_rng(seed)
+
+        obs_len = 6 + self.max_balls*6 + 2 + 2 + self.max_bricks*3 + self.max_powerups*3
+        observation_space = gym.spaces.Box(np.full(obs_len, -1000, dtype=np.float32),
+                                           np.full(obs_len, 2000, dtype=np.float32), dtype=np.float32)
+        super().__init__(num_envs, observation_space, gym.spaces.Discrete(3))
+
+        n, b, p = num_envs, max_balls, max_powerup_slots
+        self._env_index = np.arange(n)
+
+        # Paddles (rect x and width; y is fixed)
+        self.player_x = np.zeros(n)
+        self.player_w = np.zeros(n)
+        self.ai_x = np.zeros(n)
+        self.ai_w = np.zeros(n)
+
+        # Balls (sub-pixel top-left, velocity, owner = who last hit it)
+        self.ball_x = np.zeros((n, b))
+        self.ball_y = np.zeros((n, b))
+        self.ball_vx = np.zeros((n, b))
+        self.ball_vy = np.zeros((n, b))
+        self.ball_alive = np.zeros((n, b), dtype=bool)
+        self.ball_owner = np.zeros((n, b), dtype=np.int8)
+
+        # Bricks
+        self.brick_type = np.zeros((n, NUM_CELLS), dtype=np.int8)
+        self.brick_hits = np.zeros((n, NUM_CELLS), dtype=np.int16)
+        self.breakable_total = np.zeros(n, dtype=np.int32)
+
+        # Power-ups (rect top-left, vy > 0 means falling toward the player)
+        self.pu_x = np.zeros((n, p))
+        self.pu_y = np.zeros((n, p))
+        self.pu_vy = np.zeros((n, p))
+        self.pu_type = np.zeros((n, p), dtype=np.int8)
+        self.pu_alive = np.zeros((n, p), dtype=bool)
+
+        # Per-match counters and timers (ticks)
+        self.ticks = np.zeros(n, dtype=np.int64)
+        self.last_mult_tick = np.zeros(n, dtype=np.int64)
+        self.level_timer_tick = np.full(n, -1, dtype=np.int64)
+        self.player_balls_lost = np.zeros(n, dtype=np.int32)
+        self.ai_balls_lost = np.zeros(n, dtype=np.int32)
+        self.no_move_steps = np.zeros(n, dtype=np.int32)
+
+        self._obs = np.zeros((n, obs_len), dtype=np.float32)
+        self._actions = np.zeros(n, dtype=np.int64)
+
+    # ---------------------------- VecEnv API ----------------------------
+    def reset(self):
+        if self._seeds[0] is not None:
+            self.rng = np.random.default_rng(self._seeds[0])
+        self._reset_envs(self._env_index, center_paddles=True)
+        self._reset_seeds()
+        self._reset_options()
+        return self._get_obs().copy()
+
+    def step_async(self, actions):
+        self._actions = np.asarray(actions).reshape(self.num_envs)
+
+    def step_wait(self):
+        # Frame-skip: each match repeats its action for action_repeat ticks and
+        # stops early once its episode ends, like BrickPongEnv.step
+        rewards = np.zeros(self.num_envs)
+        dones = np.zeros(self.num_envs, dtype=bool)
+        infos = [{} for _ in range(self.num_envs)]
+        player_x, ai_x = self.player_x.copy(), self.ai_x.copy()
+        for _ in range(self.action_repeat):
+            step_rewards, step_dones, _ = self._step(self._actions)
+            rewards += np.where(dones, 0, step_rewards)
+            finished = np.nonzero(step_dones & ~dones)[0]
+            if finished.size:
+                self._record_terminal(finished, self._get_obs(), infos)
+                player_x[finished], ai_x[finished] = self.player_x[finished], self.ai_x[finished]
+                dones[finished] = True
+                if dones.all():
+                    break
+
+        done_idx = np.nonzero(dones)[0]
+        if done_idx.size:
+            # Finished matches carry their paddles from the tick they ended on
+            self.player_x[done_idx], self.ai_x[done_idx] = player_x[done_idx], ai_x[done_idx]
+            self._reset_envs(done_idx)
+        return self._get_obs().copy(), rewards.astype(np.float32), dones, infos
+
+    def _record_terminal(self, envs, obs, infos):
+        bricks_left = (self.brick_type[envs] > 0).sum(axis=1)
+        for i, env in enumerate(envs):
+            infos[env] = {
+                "terminal_observation": obs[env].copy(),
+                "TimeLimit.truncated": False,
+                "winner": "agent" if bricks_left[i] == 0 else "env",
+                "balls_left": int(self.ball_alive[env].sum()),
+                "bricks_left": int(bricks_left[i]),
+                "player_balls_lost": int(self.player_balls_lost[env]),
+            }
+
+    def close(self):
+        pass
+
+    def get_attr(self, attr_name, indices=None):
+        return [getattr(self, attr_name)] * len(self._get_indices(indices))
+
+    def set_attr(self, attr_name, value, indices=None):
+        setattr(self, attr_name, value)
+
+    def env_method(self, method_name, *method_args, indices=None, **method_kwargs):
+        method = getattr(self, method_name)
+        return [method(*method_args, **method_kwargs) for _ in self._get_indices(indices)]
+
+    def env_is_wrapped(self, wrapper_class, indices=None):
+        return [False] * len(self._get_indices(indices))
+
+    # ---------------------------- SIMULATION ----------------------------
+    def _reset_envs(self, envs, center_paddles=False):
+        """New round; paddles stay put like GameCore.reset_level unless center_paddles (a fresh GameCore)."""
+        count = len(envs)
+        if center_paddles:
+            center_x = (GAME_WIDTH - PADDLE_WIDTH) // 2
+            self.player_x[envs] = center_x
+            self.ai_x[envs] = center_x
+        self.player_w[envs] = PADDLE_WIDTH
+        self.ai_w[envs] = PADDLE_WIDTH
+
+        # One ball above the player paddle going up, one below the AI paddle going down
+        self.ball_alive[envs] = False
+        self.ball_alive[envs, :2] = True
+        self.ball_x[envs, 0] = self.player_x[envs] + PADDLE_WIDTH // 2 - BALL_RADIUS
+        self.ball_x[envs, 1] = self.ai_x[envs] + PADDLE_WIDTH // 2 - BALL_RADIUS
+        self.ball_y[envs, 0] = PLAYER_Y - 20 - BALL_RADIUS
+        self.ball_y[envs, 1] = AI_Y + PADDLE_HEIGHT + 20 - BALL_RADIUS
+        self.ball_vx[envs, :2] = self.rng.choice([-1.0, 1.0], size=(count, 2)) * INITIAL_BALL_SPEED
+        self.ball_vy[envs, 0] = -INITIAL_BALL_SPEED
+        self.ball_vy[envs, 1] = INITIAL_BALL_SPEED
+        self.ball_owner[envs, 0] = PLAYER
+        self.ball_owner[envs, 1] = AI
+
+        types = random_layouts(self.level, count, self.rng)
+        self.brick_type[envs] = types
+        self.brick_hits[envs] = BRICK_HITS[types]
+        self.brick_hits[envs, BOSS_CELL] = np.where(types[:, BOSS_CELL] > 0, self.level * 2, 0)
+        self.breakable_total[envs] = (self.brick_hits[envs] > 0).sum(axis=1)
+
+        self.pu_alive[envs] = False
+        self.ticks[envs] = 0
+        self.last_mult_tick[envs] = 0
+        self.level_timer_tick[envs] = -1
+        self.player_balls_lost[envs] = 0
+        self.ai_balls_lost[envs] = 0
+        self.no_move_steps[envs] = 0
+
+    def _move_paddle(self, x, w, dx):
+        return np.clip(x + dx, 0, GAME_WIDTH - w)
+
+    def _update_ai(self):
+        """Vectorized AIPaddle.update: chase the ball closest to the paddle vertically."""
+        n = self.num_envs
+        ai_cx = self.ai_x + self.ai_w // 2
+        ai_cy = AI_Y + PADDLE_HEIGHT // 2
+        gap = np.where(self.ball_alive, np.abs(_round_coord(self.ball_y) + BALL_RADIUS - ai_cy), np.inf)
+        target = gap.argmin(axis=1)
+        has_ball = self.ball_alive.any(axis=1)
+        target_x = _round_coord(self.ball_x[self._env_index, target]) + BALL_RADIUS
+
+        jitter = self.rng.choice([0, -1, 1], size=n) * self.rng.integers(0, 3, size=n)
+        dx = np.where(target_x + jitter < ai_cx, -PADDLE_SPEED,
+                      np.where(target_x + jitter > ai_cx, PADDLE_SPEED, 0))
+        self.ai_x = np.where(has_ball, self._move_paddle(self.ai_x, self.ai_w, dx), self.ai_x)
+
+        # Occasionally move randomly even if aligned
+        wander = has_ball & (self.rng.random(n) < 0.05)
+        wander_dx = self.rng.choice([-PADDLE_SPEED, PADDLE_SPEED], size=n)
+        self.ai_x = np.where(wander, self._move_paddle(self.ai_x, self.ai_w, wander_dx), self.ai_x)
+
+    def _first_free(self, alive, envs):
+        """First free slot per env in `envs` (or -1 when full)."""
+        free = ~alive[envs]
+        return np.where(free.any(axis=1), free.argmax(axis=1), -1)
+
+    def _add_balls(self, envs, x, y, vx, vy, owner):
+        slot = self._first_free(self.ball_alive, envs)
+        ok = slot >= 0
+        envs, slot = envs[ok], slot[ok]
+        self.ball_x[envs, slot] = x[ok]
+        self.ball_y[envs, slot] = y[ok]
+        self.ball_vx[envs, slot] = vx[ok]
+        self.ball_vy[envs, slot] = vy[ok]
+        self.ball_owner[envs, slot] = owner[ok]
+        self.ball_alive[envs, slot] = True
+
+    def _break_bricks(self, envs, cells, breaker, player_broken):
+        """Remove broken bricks and credit them; player credit feeds the reward."""
+        self.brick_type[envs, cells] = 0
+        self.brick_hits[envs, cells] = 0
+        np.add.at(player_broken, envs[breaker == PLAYER], 1)
+
+    def _update_ball_slot(self, j, rewards, player_broken):
+        """GameCore._move_ball for the balls in slot j: impacts resolved in time-of-impact order."""
+        # Work on the matches that have a ball in this slot, then scatter back
+        envs = np.nonzero(self.ball_alive[:, j])[0]
+        if envs.size == 0:
+            return
+        x, y = self.ball_x[envs, j], self.ball_y[envs, j]
+        vx = np.clip(self.ball_vx[envs, j], -MAX_SPEED, MAX_SPEED)
+        vy = np.clip(self.ball_vy[envs, j], -MAX_SPEED, MAX_SPEED)
+        owner = self.ball_owner[envs, j]
+        remaining = np.ones(envs.size)
+        last = np.full(envs.size, HIT_NONE, dtype=np.int16)
+        alive = np.ones(envs.size, dtype=bool)
+        rows = np.arange(envs.size)  # Balls with time left to move
+
+        for _ in range(MAX_IMPACTS_PER_STEP):
+            t, hit, axis = self._next_impact(envs[rows], x[rows], y[rows], vx[rows], vy[rows],
+                                             remaining[rows], last[rows])
+            x[rows] += vx[rows] * t
+            y[rows] += vy[rows] * t
+            remaining[rows] -= t
+            moving = hit != HIT_NONE
+            rows, hit, axis = rows[moving], hit[moving], axis[moving]
+            if rows.size == 0:
+                break
+            last[rows] = hit
+
+            # Side walls, with a little noise
+            noise = self.rng.uniform(-0.2, 0.2, size=rows.size)
+            r = rows[hit == HIT_LEFT]
+            x[r] = 0
+            vx[r] = np.abs(vx[r]) + noise[hit == HIT_LEFT]
+            r = rows[hit == HIT_RIGHT]
+            x[r] = GAME_WIDTH - BALL_SIZE
+            vx[r] = -np.abs(vx[r]) + noise[hit == HIT_RIGHT]
+
+            # Lost off the top (AI) or bottom (player)
+            lost_ai, lost_player = rows[hit == HIT_AI_GOAL], rows[hit == HIT_PLAYER_GOAL]
+            self.ai_balls_lost[envs[lost_ai]] += 1
+            self.player_balls_lost[envs[lost_player]] += 1
+            rewards[envs[lost_player]] -= 10.0
+            alive[lost_ai] = False
+            alive[lost_player] = False
+
+            # Paddles: angle depends on where the ball hits
+            r = rows[hit == HIT_PLAYER_PADDLE]
+            if r.size:
+                player_x, player_w = self.player_x[envs[r]], self.player_w[envs[r]]
+                offset = (x[r] + BALL_RADIUS - (player_x + player_w // 2)) / (player_w / 2)
+                vx[r] = INITIAL_BALL_SPEED * offset * 1.5
+                vy[r] = -np.abs(vy[r])
+                y[r] = PLAYER_Y - BALL_SIZE
+                owner[r] = PLAYER
+                rewards[envs[r]] += 0.6
+            r = rows[hit == HIT_AI_PADDLE]
+            if r.size:
+                ai_x, ai_w = self.ai_x[envs[r]], self.ai_w[envs[r]]
+                offset = (x[r] + BALL_RADIUS - (ai_x + ai_w // 2)) / (ai_w / 2)
+                vx[r] = INITIAL_BALL_SPEED * offset * 1.5
+                vy[r] = np.abs(vy[r])
+                y[r] = AI_Y + PADDLE_HEIGHT
+                owner[r] = AI
+
+            # Bricks: reflect off the face that was touched, then damage
+            brick = hit < NUM_CELLS
+            if brick.any():
+                r, cells, axis = rows[brick], hit[brick], axis[brick]
+                s = (axis & AXIS_X) > 0
+                x[r[s]] = np.where(vx[r[s]] > 0, CELL_X[cells[s]] - BALL_SIZE, CELL_X[cells[s]] + CELL_W[cells[s]])
+                vx[r[s]] = -vx[r[s]]
+                s = (axis & AXIS_Y) > 0
+                y[r[s]] = np.where(vy[r[s]] > 0, CELL_Y[cells[s]] - BALL_SIZE, CELL_Y[cells[s]] + BRICK_HEIGHT)
+                vy[r[s]] = -vy[r[s]]
+
+                # Brick.hit: unbreakable bricks (hits < 0) never lose hit points
+                hit_envs = envs[r]
+                hp = self.brick_hits[hit_envs, cells]
+                damaged = hp > 0
+                self.brick_hits[hit_envs, cells] = np.where(damaged, hp - 1, hp)
+                broken = damaged & (hp == 1)
+                if broken.any():
+                    self._break_bricks(hit_envs[broken], cells[broken], owner[r[broken]], player_broken)
+                    self._spawn_powerups(hit_envs[broken], cells[broken], owner[r[broken]])
+
+            rows = rows[alive[rows]]
+            np.clip(vx, -MAX_SPEED, MAX_SPEED, out=vx)
+            np.clip(vy, -MAX_SPEED, MAX_SPEED, out=vy)
+
+        # Whatever happens, the ball ends the step inside the side walls
+        self.ball_x[envs, j] = np.clip(x, 0, GAME_WIDTH - BALL_SIZE)
+        self.ball_y[envs, j] = y
+        self.ball_vx[envs, j] = vx
+        self.ball_vy[envs, j] = vy
+        self.ball_owner[envs, j] = owner
+        self.ball_alive[envs, j] = alive
+
+    def _next_impact(self, envs, x, y, vx, vy, horizon, last):
+        """
+        GameCore._next_impact on arrays: (t, hit, axis) for the earliest thing
+        each ball runs into within horizon ticks, hit = HIT_NONE if nothing.
+        """
+        t_hit = horizon.copy()
+        hit = np.full(x.size, HIT_NONE, dtype=np.int16)
+        axis = np.zeros(x.size, dtype=np.int8)
+
+        # Side walls and the two goal lines
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_wall = np.maximum(np.where(vx < 0, -x / vx, (GAME_WIDTH - BALL_SIZE - x) / vx), 0.0)
+            t_goal = np.maximum(np.where(vy < 0, -y / vy, (SCREEN_HEIGHT - BALL_SIZE - y) / vy), 0.0)
+        wall = np.where(vx < 0, HIT_LEFT, HIT_RIGHT)
+        take = (vx != 0) & (last != wall) & (t_wall <= t_hit)
+        t_hit = np.where(take, t_wall, t_hit)
+        hit = np.where(take, wall, hit)
+        take = (vy != 0) & (t_goal <= t_hit)
+        t_hit = np.where(take, t_goal, t_hit)
+        hit = np.where(take, np.where(vy < 0, HIT_AI_GOAL, HIT_PLAYER_GOAL), hit)
+
+        # Paddles only catch a ball travelling toward them
+        down = vy > 0
+        paddle = np.where(down, HIT_PLAYER_PADDLE, HIT_AI_PADDLE)
+        t0, _, valid = _sweep_balls(x, y, vx, vy,
+                                    np.where(down, self.player_x[envs], self.ai_x[envs]),
+                                    np.where(down, PLAYER_Y, AI_Y),
+                                    np.where(down, self.player_w[envs], self.ai_w[envs]), PADDLE_HEIGHT)
+        take = (vy != 0) & (last != paddle) & valid & (t0 < t_hit)
+        t_hit = np.where(take, np.maximum(t0, 0.0), t_hit)
+        hit = np.where(take, paddle, hit)
+
+        # Bricks under the box swept up to the earliest hit so far: at most 2 x 2 lattice
+        # cells at MAX_SPEED, plus the boss slot, checked in list order like BrickGrid.query
+        end_x, end_y = x + vx * t_hit, y + vy * t_hit
+        left = np.floor(np.minimum(x, end_x))
+        right = np.ceil(np.maximum(x, end_x)) + BALL_SIZE
+        top = np.floor(np.minimum(y, end_y))
+        bottom = np.ceil(np.maximum(y, end_y)) + BALL_SIZE
+        c_lo = np.clip((left - BRICK_OFFSET_X) // BRICK_PITCH_X, 0, BRICK_COLS - 1).astype(np.intp)
+        c_hi = np.clip((right - 1 - BRICK_OFFSET_X) // BRICK_PITCH_X, 0, BRICK_COLS - 1).astype(np.intp)
+        r_lo = np.clip((top - BRICK_OFFSET_Y) // BRICK_PITCH_Y, 0, BRICK_ROWS - 1).astype(np.intp)
+        r_hi = np.clip((bottom - 1 - BRICK_OFFSET_Y) // BRICK_PITCH_Y, 0, BRICK_ROWS - 1).astype(np.intp)
+        new_col, new_row = c_hi != c_lo, r_hi != r_lo
+        for cells, distinct in ((r_lo * BRICK_COLS + c_lo, True),
+                                (r_lo * BRICK_COLS + c_hi, new_col),
+                                (r_hi * BRICK_COLS + c_lo, new_row),
+                                (r_hi * BRICK_COLS + c_hi, new_col & new_row),
+                                (np.full(x.size, BOSS_CELL), True)):
+            t0, face, valid = _sweep_balls(x, y, vx, vy, CELL_X[cells], CELL_Y[cells], CELL_W[cells], BRICK_HEIGHT)
+            take = distinct & (self.brick_type[envs, cells] > 0) & (last != cells) & valid & (t0 < t_hit)
+            t_hit = np.where(take, np.maximum(t0, 0.0), t_hit)
+            hit = np.where(take, cells, hit)
+            axis = np.where(take, face, axis)
+        return t_hit, hit, axis
+
+    def _spawn_powerups(self, envs, cells, breaker):
+        """Chance to spawn a power-up toward whoever broke the brick."""
+        spawn = self.rng.random(envs.size) < 0.25
+        envs, cells, breaker = envs[spawn], cells[spawn], breaker[spawn]
+        slot = self._first_free(self.pu_alive, envs)
+        ok = slot >= 0
+        envs, cells, breaker, slot = envs[ok], cells[ok], breaker[ok], slot[ok]
+        self.pu_x[envs, slot] = CELL_CX[cells] - POWERUP_SIZE // 2
+        self.pu_y[envs, slot] = CELL_CY[cells] - POWERUP_SIZE // 2
+        self.pu_vy[envs, slot] = np.where(breaker == PLAYER, 2.0, -2.0)
+        self.pu_type[envs, slot] = self.rng.integers(0, NUM_POWERUP_TYPES, size=envs.size)
+        self.pu_alive[envs, slot] = True
+
+    def _update_powerup_slot(self, k, player_broken):
+        alive = self.pu_alive[:, k]
+        if not alive.any():
+            return
+        self.pu_y[alive, k] += self.pu_vy[alive, k]
+        x, y, vy = self.pu_x[:, k], self.pu_y[:, k], self.pu_vy[:, k]
+
+        # Test the whole stretch it fell through, like GameCore._update_power_ups
+        top = np.where(vy > 0, y - vy, y)
+        height = POWERUP_SIZE + np.abs(vy)
+        by_player = alive & (vy > 0) & _overlaps(x, top, POWERUP_SIZE, height,
+                                                  self.player_x, PLAYER_Y, self.player_w, PADDLE_HEIGHT)
+        by_ai = alive & (vy < 0) & _overlaps(x, top, POWERUP_SIZE, height,
+                                              self.ai_x, AI_Y, self.ai_w, PADDLE_HEIGHT)
+        collected = by_player | by_ai
+        offscreen = alive & ~collected & (((vy > 0) & (y > SCREEN_HEIGHT)) |
+                                          ((vy < 0) & (y + POWERUP_SIZE < 0)))
+        self.pu_alive[:, k] = alive & ~(collected | offscreen)
+        if not collected.any():
+            return
+
+        kind = self.pu_type[:, k]
+        collector = np.where(by_player, PLAYER, AI)
+
+        scale = np.where(collected & (kind == PU_SPEED), 1.1,
+                         np.where(collected & (kind == PU_SLOW), 0.7, 1.0))
+        self.ball_vx *= scale[:, None]
+        self.ball_vy *= scale[:, None]
+
+        grow = collected & (kind == PU_SIZE)
+        grow_player, grow_ai = grow & by_player, grow & by_ai
+        self.player_w[grow_player] = np.minimum(PADDLE_WIDTH * 2, _round_coord(self.player_w[grow_player] * 1.2))
+        self.ai_w[grow_ai] = np.minimum(PADDLE_WIDTH * 2, _round_coord(self.ai_w[grow_ai] * 1.2))
+
+        multi = np.nonzero(collected & (kind == PU_MULTI) & self.ball_alive.any(axis=1))[0]
+        if multi.size:
+            first = self.ball_alive[multi].argmax(axis=1)
+            self._add_balls(multi, _round_coord(self.ball_x[multi, first]), _round_coord(self.ball_y[multi, first]),
+                            self.rng.choice([-1.0, 1.0], size=multi.size) * INITIAL_BALL_SPEED,
+                            np.where(collector[multi] == PLAYER, -1.0, 1.0) * INITIAL_BALL_SPEED,
+                            collector[multi])
+
+        laser = np.nonzero(collected & (kind == PU_LASER))[0]
+        if laser.size:
+            laser_x = np.where(collector[laser] == PLAYER,
+                               self.player_x[laser] + self.player_w[laser] // 2,
+                               self.ai_x[laser] + self.ai_w[laser] // 2)
+            in_beam = (np.abs(CELL_CX[None, :] - laser_x[:, None]) < LASER_WIDTH + CELL_W // 2) & \
+                (self.brick_type[laser] > 0)
+            rows, cells = np.nonzero(in_beam)
+            self._break_bricks(laser[rows], cells, collector[laser][rows], player_broken)
+
+    def _step(self, actions):
+        n = self.num_envs
+        rewards = np.zeros(n)
+        player_broken = np.zeros(n, dtype=np.int64)
+        self.ticks += 1
+        now = self._ticks_to_ms(self.ticks)
+
+        # --- Paddles ---
+        prev_cx = self.player_x + self.player_w // 2
+        dx = np.where(actions == ACTION_LEFT, -PADDLE_SPEED, np.where(actions == ACTION_RIGHT, PADDLE_SPEED, 0))
+        self.player_x = self._move_paddle(self.player_x, self.player_w, dx)
+        self._update_ai()
+
+        # --- Balls (slot order matches GameCore's list order) ---
+        for j in range(self.max_balls):
+            self._update_ball_slot(j, rewards, player_broken)
+        self._compact_balls()
+
+        # --- Power-ups ---
+        for k in range(self.max_powerup_slots):
+            self._update_powerup_slot(k, player_broken)
+        self._compact_balls()
+        self._compact_powerups()
+
+        # --- Ball Multiplication ---
+        ball_count = self.ball_alive.sum(axis=1)
+        multiply = (now - self._ticks_to_ms(self.last_mult_tick) > BALL_MULT_INTERVAL) & (ball_count < MAX_BALLS)
+        if multiply.any():
+            for i in range(self.max_balls):
+                envs = np.nonzero(multiply & (i < ball_count) & (ball_count + i < self.max_balls))[0]
+                if envs.size == 0:
+                    break
+                dst = ball_count[envs] + i
+                # New balls start on the rounded rect, like Ball(ball.rect.centerx, ...)
+                self.ball_x[envs, dst] = _round_coord(self.ball_x[envs, i])
+                self.ball_y[envs, dst] = _round_coord(self.ball_y[envs, i])
+                self.ball_vx[envs, dst] = -self.ball_vx[envs, i]
+                self.ball_vy[envs, dst] = self.ball_vy[envs, i]
+                self.ball_owner[envs, dst] = np.where(self.ball_vy[envs, i] > 0, AI, PLAYER)
+                self.ball_alive[envs, dst] = True
+            self.last_mult_tick[multiply] = self.ticks[multiply]
+
+        # --- Level-advance timer (80% of breakable bricks cleared) ---
+        breakable_left = (self.brick_hits > 0).sum(axis=1)
+        start = (self.level_timer_tick < 0) & (self.breakable_total > 0) & \
+            (breakable_left <= 0.2 * self.breakable_total)
+        self.level_timer_tick[start] = self.ticks[start]
+        timer_done = (self.level_timer_tick >= 0) & \
+            (now - self._ticks_to_ms(self.level_timer_tick) >= LEVEL_ADVANCE_DELAY)
+
+        # --- Reward shaping (same terms as BrickPongEnv.step) ---
+        player_cx = self.player_x + self.player_w // 2
+        moved = player_cx != prev_cx
+        rewards += 0.06 * moved
+        rewards -= 0.01 * ((self.player_x <= 0) | (self.player_x + self.player_w >= GAME_WIDTH))
+        self.no_move_steps = np.where(moved, 0, self.no_move_steps + 1)
+        rewards -= 0.05 * (self.no_move_steps >= 10)
+        rewards += player_broken + 0.5 * np.maximum(player_broken - 1, 0)
+
+        round_over = ~self.ball_alive.any(axis=1) | ~(self.brick_type > 0).any(axis=1) | timer_done
+        dones = round_over | (self.player_balls_lost >= 5)
+        return rewards, dones, player_broken
+
+    def _ticks_to_ms(self, ticks):
+        return ticks * 1000 // FPS
+
+    def _compact_balls(self):
+        """Keep live balls at the front, in order, like removals from a Python list."""
+        if not (self.ball_alive[:, 1:] & ~self.ball_alive[:, :-1]).any():
+            return
+        order = np.argsort(~self.ball_alive, axis=1, kind="stable")
+        rows = self._env_index[:, None]
+        for name in ("ball_x", "ball_y", "ball_vx", "ball_vy", "ball_alive", "ball_owner"):
+            setattr(self, name, getattr(self, name)[rows, order])
+
+    def _compact_powerups(self):
+        if not (self.pu_alive[:, 1:] & ~self.pu_alive[:, :-1]).any():
+            return
+        order = np.argsort(~self.pu_alive, axis=1, kind="stable")
+        rows = self._env_index[:, None]
+        for name in ("pu_x", "pu_y", "pu_vy", "pu_type", "pu_alive"):
+            setattr(self, name, getattr(self, name)[rows, order])
+
+    # ---------------------------- OBSERVATION ----------------------------
+    def _get_obs(self):
+        """Same layout as BrickPongEnv._get_obs, built for all matches at once."""
+        obs = self._obs
+        obs[:] = 0
+        player_cx = self.player_x + self.player_w // 2
+        player_cy = PLAYER_Y + PADDLE_HEIGHT // 2
+        obs[:, 0] = player_cx
+        obs[:, 1] = self.ai_x + self.ai_w // 2
+        obs[:, 2] = self.player_x
+        obs[:, 3] = self.player_x + self.player_w
+        obs[:, 4] = self.ai_x
+        obs[:, 5] = self.ai_x + self.ai_w
+
+        # Balls: x, y, vx, vy, distance to paddle, distance to nearest brick
+        alive = self.ball_alive
+        cx = _round_coord(self.ball_x) + BALL_RADIUS  # Rect centres, as BrickPongEnv reports them
+        cy = _round_coord(self.ball_y) + BALL_RADIUS
+        present = self.brick_type > 0
+        # Nearest brick only for live balls, on squared float32 distances
+        brick_dist = np.zeros(alive.shape)
+        envs, slots = np.nonzero(alive)
+        dist_sq = (cx[envs, slots, None].astype(np.float32) - CELL_CX_F32) ** 2 + \
+            (cy[envs, slots, None].astype(np.float32) - CELL_CY_F32) ** 2
+        nearest = np.where(present[envs], dist_sq, np.float32(np.inf)).min(axis=1)
+        brick_dist[envs, slots] = np.where(np.isinf(nearest), 0, np.sqrt(nearest))
+        ball_block = np.stack([cx, cy, self.ball_vx, self.ball_vy,
+                               np.hypot(cx - player_cx[:, None], cy - player_cy), brick_dist], axis=2)
+        ball_block *= alive[:, :, None]
+        end = 6 + self.max_balls * 6
+        obs[:, 6:end] = ball_block.reshape(self.num_envs, -1)
+
+        # Closest ball to the player paddle (Manhattan distance)
+        dx = cx - player_cx[:, None]
+        dy = cy - player_cy
+        manhattan = np.where(alive, np.abs(dx) + np.abs(dy), np.inf)
+        closest = manhattan.argmin(axis=1)
+        has_ball = alive.any(axis=1)
+        obs[:, end] = np.where(has_ball, dx[self._env_index, closest], 0)
+        obs[:, end + 1] = np.where(has_ball, dy[self._env_index, closest], 0)
+        obs[:, end + 2] = alive.sum(axis=1)
+        obs[:, end + 3] = present.sum(axis=1)
+        end += 4
+
+        # First max_bricks bricks in list order: x, y, type (padded with 0, 0, -1)
+        rank = np.cumsum(present, axis=1, dtype=np.int16)
+        envs, cells = np.nonzero(present & (rank <= self.max_bricks))
+        bricks = obs[:, end:end + self.max_bricks * 3].reshape(self.num_envs, self.max_bricks, 3)
+        bricks[:, :, 2] = -1
+        slots = rank[envs, cells] - 1
+        bricks[envs, slots, 0] = CELL_CX[cells]
+        bricks[envs, slots, 1] = CELL_CY[cells]
+        bricks[envs, slots, 2] = self.brick_type[envs, cells]
+        obs[:, end:end + self.max_bricks * 3] = bricks.reshape(self.num_envs, -1)
+        end += self.max_bricks * 3
+
+        # First max_powerups power-ups: x, y, type
+        shown = self.pu_alive[:, :self.max_powerups]
+        powerups = np.stack([np.where(shown, self.pu_x[:, :self.max_powerups] + POWERUP_SIZE // 2, 0),
+                             np.where(shown, self.pu_y[:, :self.max_powerups] + POWERUP_SIZE // 2, 0),
+                             np.where(shown, self.pu_type[:, :self.max_powerups], -1)], axis=2)
+        obs[:, end:end + self.max_powerups * 3] = powerups.reshape(self.num_envs, -1)
+        return obs
+
+def benchmark(num_envs=1024, steps=500):
+    """Steps/sec of this env versus the DummyVecEnv(4 x BrickPongEnv) setup in rl_train_compare_v2.py."""
+    import time
+    from stable_baselines3.common.vec_env import DummyVecEnv
+    from brickpong_gym_env import BrickPongEnv
+
+    dummy = DummyVecEnv([BrickPongEnv for _ in range(4)])
+    dummy.reset()
+    start = time.perf_counter()
+    for _ in range(steps):
+        dummy.step(np.random.randint(0, 3, size=4))
+    dummy_sps = 4 * steps / (time.perf_counter() - start)
+
+    vec = BrickPongVecEnv(num_envs=num_envs, seed=0)
+    vec.reset()
+    start = time.perf_counter()
+    for _ in range(steps):
+        vec.step(np.random.randint(0, 3, size=num_envs))
+    vec_sps = num_envs * steps / (time.perf_counter() - start)
+
+    print(f"DummyVecEnv x4:         {dummy_sps:12,.0f} steps/s")
+    print(f"BrickPongVecEnv x{num_envs}: {vec_sps:12,.0f} steps/s ({vec_sps / dummy_sps:.0f}x)")
+
+def parity_check(episodes=400, num_envs=16, seed=0):
+    """
+    Mean episode length and return under a random policy, this env versus
+    BrickPongEnv; they should agree to within sampling noise. Keep num_envs
+    well below episodes so most rounds start from carried-over paddles.
+    """
+    from brickpong_gym_env import BrickPongEnv
+
+    rng = np.random.default_rng(seed)
+    env = BrickPongEnv(rl_mode=True)
+    env.reset(seed=seed)
+    lengths, returns = [], []
+    while len(lengths) < episodes:
+        env.reset()
+        length, total, done = 0, 0.0, False
+        while not done:
+            _, reward, done, _, _ = env.step(int(rng.integers(3)))
+            length += 1
+            total += reward
+        lengths.append(length)
+        returns.append(total)
+    single = (np.mean(lengths), np.mean(returns))
+
+    vec = BrickPongVecEnv(num_envs=num_envs, seed=seed)
+    vec.reset()
+    length = np.zeros(num_envs, dtype=np.int64)
+    total = np.zeros(num_envs)
+    lengths, returns = [], []
+    while len(lengths) < episodes:
+        _, rewards, dones, _ = vec.step(rng.integers(3, size=num_envs))
+        length += 1
+        total += rewards
+        lengths.extend(length[dones])
+        returns.extend(total[dones])
+        length[dones] = 0
+        total[dones] = 0
+    batched = (np.mean(lengths[:episodes]), np.mean(returns[:episodes]))
+
+    print(f"BrickPongEnv:    length {single[0]:8.1f}  return {single[1]:+8.2f}")
+    print(f"BrickPongVecEnv: length {batched[0]:8.1f}  return {batched[1]:+8.2f}")
+    return single, batched
+
+if __name__ == "__main__":
+    benchmark()
+    parity_check()
@@ -0,0 +1,189 @@
+import numpy as np
+
+# ---------------------------- CAPACITIES ----------------------------
+MAX_PARTICLES = 4096   # 15 per broken brick and 40 frames of life: a full laser column plus plenty of spare
+MAX_EXPLOSIONS = 64
+MAX_LASERS = 16
+MAX_TEXTS = 32
+
+# ---------------------------- POOLS ----------------------------
+class EffectPool:
+    """Fixed-capacity pool of one kind of effect, one NumPy array per field, with a free-slot stack."""
+
+    FIELDS = {}
+    CAPACITY = 0
+
+    def __init__(self, capacity=None):
+        self.capacity = capacity = capacity or self.CAPACITY
+        for name, (dtype, shape) in self.FIELDS.items():
+            setattr(self, name, np.zeros((capacity,) + shape, dtype=dtype))
+        self.alive = np.zeros(capacity, dtype=bool)
+        self._free = np.arange(capacity - 1, -1, -1, dtype=np.int32)  # Slot 0 is handed out first
+        self._free_top = capacity
+        self.count = 0
+
+    def allocate(self, n):
+        """Take up to n free slots and return their indices."""
+        n = min(n, self._free_top)
+        slots = self._free[self._free_top - n:self._free_top].copy()
+        self._free_top -= n
+        self.alive[slots] = True
+        self.count += n
+        return slots
+
+    def release(self, slots):
+        n = len(slots)
+        if n == 0:
+            return
+        self.alive[slots] = False
+        self._free[self._free_top:self._free_top + n] = slots
+        self._free_top += n
+        self.count -= n
+
+    def active(self):
+        """Indices of the live slots."""
+        return np.flatnonzero(self.alive)
+
+    def clear(self):
+        self.alive[:] = False
+        self._free[:] = np.arange(self.capacity - 1, -1, -1)
+        self._free_top = self.capacity
+        self.count = 0
+
+class ParticlePool(EffectPool):
+    """Square brick debris: drifts at a constant velocity for `life` frames."""
+
+    FIELDS = {
+        "pos": (np.float32, (2,)),
+        "vel": (np.float32, (2,)),
+        "life": (np.int16, ()),
+        "size": (np.int16, ()),
+        "color": (np.uint8, (3,)),
+    }
+    CAPACITY = MAX_PARTICLES
+
+    def __init__(self, capacity=None, rng=None):
+        super().__init__(capacity)
+        # Own generator, so visuals never shift the simulation's random sequence
+        self.rng = rng if rng is not None else np.random.default_rng()
+
+    def burst(self, x, y, color, n=15, speed=4, life=40, min_size=2, max_size=6):
+        """n particles flying out of (x, y) in random directions."""
+        slots = self.allocate(n)
+        n = len(slots)
+        self.pos[slots] = (x, y)
+        self.vel[slots] = self.rng.uniform(-speed, speed, size=(n, 2))
+        self.life[slots] = life
+        self.size[slots] = self.rng.integers(min_size, max_size + 1, size=n)
+        self.color[slots] = color[:3]
+
+    def update(self):
+        if self.count == 0:
+            return
+        slots = self.active()
+        self.pos[slots] += self.vel[slots]
+        self.life[slots] -= 1
+        self.release(slots[self.life[slots] <= 0])
+
+class ExplosionPool(EffectPool):
+    """Expanding rings where a ball was lost."""
+
+    FIELDS = {
+        "pos": (np.int32, (2,)),
+        "radius": (np.int16, ()),
+        "max_radius": (np.int16, ()),
+        "color": (np.uint8, (3,)),
+    }
+    CAPACITY = MAX_EXPLOSIONS
+
+    def spawn(self, x, y, color, radius=10, max_radius=40):
+        slots = self.allocate(1)
+        self.pos[slots] = (x, y)
+        self.radius[slots] = radius
+        self.max_radius[slots] = max_radius
+        self.color[slots] = color[:3]
+
+    def update(self):
+        if self.count == 0:
+            return
+        slots = self.active()
+        self.radius[slots] += 2
+        self.release(slots[self.radius[slots] >= self.max_radius[slots]])
+
+class LaserPool(EffectPool):
+    """Laser beams, drawn from the top of the field down to `reach`."""
+
+    FIELDS = {
+        "x": (np.int32, ()),
+        "reach": (np.int32, ()),
+        "width": (np.int16, ()),
+        "life": (np.int16, ()),
+        "color": (np.uint8, (3,)),
+    }
+    CAPACITY = MAX_LASERS
+
+    def spawn(self, x, reach, color, width=5, life=60):
+        slots = self.allocate(1)
+        self.x[slots] = x
+        self.reach[slots] = reach
+        self.width[slots] = width
+        self.life[slots] = life
+        self.color[slots] = color[:3]
+
+    def update(self):
+        if self.count == 0:
+            return
+        slots = self.active()
+        self.life[slots] -= 1
+        self.release(slots[self.life[slots] <= 0])
+
+class TextPool(EffectPool):
+    """Centred notifications; the strings sit in a plain list indexed by slot."""
+
+    FIELDS = {
+        "pos": (np.int32, (2,)),
+        "life": (np.int16, ()),
+        "color": (np.uint8, (3,)),
+    }
+    CAPACITY = MAX_TEXTS
+
+    def __init__(self, capacity=None):
+        super().__init__(capacity)
+        self.text = [""] * self.capacity
+
+    def spawn(self, text, x, y, color, life=120):
+        slots = self.allocate(1)
+        for slot in slots:
+            self.text[slot] = text
+        self.pos[slots] = (x, y)
+        self.life[slots] = life
+        self.color[slots] = color[:3]
+
+    def update(self):
+        if self.count == 0:
+            return
+        slots = self.active()
+        self.life[slots] -= 2  # Text used to lose a frame of life when updated and again when drawn
+        self.release(slots[self.life[slots] <= 0])
+
+class Effects:
+    """All of a match's visual effects, one typed pool per kind."""
+
+    def __init__(self, rng=None):
+        self.particles = ParticlePool(rng=rng)
+        self.explosions = ExplosionPool()
+        self.lasers = LaserPool()
+        self.texts = TextPool()
+        self.pools = (self.lasers, self.explosions, self.particles, self.texts)  # Drawing order
+
+    def update(self):
+        """Advance every effect by one 60 FPS frame."""
+        for pool in self.pools:
+            pool.update()
+
+    def clear(self):
+        for pool in self.pools:
+            pool.clear()
+
+    def __len__(self):
+        return sum(pool.count for pool in self.pools)
@@ -0,0 +1,1421 @@
+import json
+import math
+import random
+import struct
+import sys
+import time
+from array import array
+from collections import OrderedDict
+
+# ---------------------------- DIMENSIONS ----------------------------
+GAME_WIDTH = 1200
+SIDE_WIDTH = 400
+SCREEN_WIDTH = GAME_WIDTH + SIDE_WIDTH  # Total width (game area + side panel)
+SCREEN_HEIGHT = 800
+FPS = 60
+
+# ---------------------------- PROPERTIES ----------------------------
+# Paddle properties
+PADDLE_WIDTH = 100
+PADDLE_HEIGHT = 20
+PADDLE_SPEED = 20  # increased speed
+
+# Ball properties
+BALL_RADIUS = 10
+INITIAL_BALL_SPEED = 5
+MAX_BALLS = 6
+MAX_IMPACTS_PER_STEP = 16  # Collisions resolved per ball per step before giving up
+
+# Event-driven advance (GameCore.advance / advance_until_decision), all in ticks
+MAX_ADVANCE_TICKS = 240   # Longest single jump
+PADDLE_WINDOW_TICKS = 4   # Single ticks this close to a paddle, so catches see the paddle where it really is
+DECISION_TICKS = 20       # advance_until_decision() hands control back this far from the player's paddle
+
+# Brick properties
+BRICK_ROWS = 10  # Increased from 6
+BRICK_COLS = 14  # Increased from 10
+BRICK_WIDTH = 70
+BRICK_HEIGHT = 30
+BRICK_GAP = 5
+
+# Brick lattice placement (top-left of cell (0, 0) and the distance between cells)
+BRICK_OFFSET_X = (GAME_WIDTH - (BRICK_COLS * BRICK_WIDTH + (BRICK_COLS - 1) * BRICK_GAP)) // 2
+BRICK_OFFSET_Y = 100  # Fixed offset from top for consistency
+BRICK_PITCH_X = BRICK_WIDTH + BRICK_GAP
+BRICK_PITCH_Y = BRICK_HEIGHT + BRICK_GAP
+
+# Ball multiplication interval (milliseconds)
+BALL_MULT_INTERVAL = 30000  # 30 seconds
+
+# Level advances this long after 80% of the breakable bricks are gone (milliseconds)
+LEVEL_ADVANCE_DELAY = 30000
+
+# Colors
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+DARK_GRAY = (50, 50, 50)
+RED   = (255, 0, 0)
+BLUE  = (0, 0, 255)
+GRAY  = (200, 200, 200)
+
+# Round scoring: points per brick type broken, and the ball-loss penalty
+# (5 for the first ball, 4 for the second, ..., capped at MAX_BALL_PENALTY)
+BRICK_POINTS = {1: 1, 2: 3, 3: 5, 4: 10, 5: 3}
+MAX_BALL_PENALTY = 15
+
+# Brick colors by type (Brick.__init__ picks the same ones)
+BRICK_COLORS = {1: BLUE, 2: RED, 3: GRAY, 4: (255, 215, 0), 5: (0, 255, 128)}
+
+# Power-up colors by type
+POWERUP_COLORS = {
+    "speed": (255, 255, 0),   # Yellow
+    "size": (0, 255, 0),      # Green
+    "multi": (255, 0, 255),   # Purple
+    "score": (255, 128, 0),   # Orange
+    "laser": (50, 150, 255),  # Light blue
+    "slow": (0, 200, 200),    # Teal
+}
+
+# Player actions (same encoding as the gym env)
+ACTION_STAY = 0
+ACTION_LEFT = 1
+ACTION_RIGHT = 2
+
+# Simulation event kinds (see EventRing) and the side codes they carry
+(EVENT_PADDLE_HIT, EVENT_BRICK_HIT, EVENT_BRICK_BROKEN, EVENT_BALL_LOST,
+ EVENT_POWERUP_COLLECTED, EVENT_LASER, EVENT_LEVEL_TIMER_STARTED) = range(7)
+EVENT_NAMES = ("paddle_hit", "brick_hit", "brick_broken", "ball_lost",
+               "powerup_collected", "laser", "level_timer_started")
+# As tuples (EventRing.as_tuple) they read
+#   ("paddle_hit", side, ball)            ("ball_lost", side, ball)
+#   ("brick_hit", brick, ball)            ("brick_broken", brick, breaker)
+#   ("powerup_collected", power_up, collector, score_bonus)
+#   ("laser", x, y_start, collector, destroyed_bricks)
+#   ("level_timer_started",)
+SIDE_NONE, SIDE_PLAYER, SIDE_AI = -1, 0, 1
+SIDE_NAMES = ("player", "ai")
+EVENT_CAPACITY = 256  # Starting ring size (a power of two); it doubles if one tick ever fills it
+
+# ---------------------------- GEOMETRY ----------------------------
+def _round_coord(value):
+    """Round half away from zero, the way pygame.Rect stores coordinates."""
+    if value >= 0:
+        return int(value + 0.5)
+    return -int(-value + 0.5)
+
+class Rect:
+    """Integer rectangle with the parts of the pygame.Rect API the simulation uses, so it runs without pygame."""
+    __slots__ = ("x", "y", "_w", "_h")
+
+    def __init__(self, x, y, w, h):
+        self.x = _round_coord(x)
+        self.y = _round_coord(y)
+        self._w = _round_coord(w)
+        self._h = _round_coord(h)
+
+    def __setattr__(self, name, value):
+        if name in ("x", "y"):
+            value = _round_coord(value)
+        object.__setattr__(self, name, value)
+
+    def __repr__(self):
+        return f"<rect({self.x}, {self.y}, {self._w}, {self._h})>"
+
+    def __iter__(self):
+        return iter((self.x, self.y, self._w, self._h))
+
+    def __len__(self):
+        return 4
+
+    def __getitem__(self, index):
+        return (self.x, self.y, self._w, self._h)[index]
+
+    def copy(self):
+        return Rect(self.x, self.y, self._w, self._h)
+
+    def colliderect(self, other):
+        return (self._w > 0 and self._h > 0 and other.width > 0 and other.height > 0 and
+                self.x < other.x + other.width and other.x < self.x + self._w and
+                self.y < other.y + other.height and other.y < self.y + self._h)
+
+    @property
+    def width(self):
+        return self._w
+
+    @width.setter
+    def width(self, value):
+        self._w = _round_coord(value)
+
+    @property
+    def height(self):
+        return self._h
+
+    @height.setter
+    def height(self, value):
+        self._h = _round_coord(value)
+
+    @property
+    def left(self):
+        return self.x
+
+    @left.setter
+    def left(self, value):
+        self.x = value
+
+    @property
+    def right(self):
+        return self.x + self._w
+
+    @right.setter
+    def right(self, value):
+        self.x = _round_coord(value) - self._w
+
+    @property
+    def top(self):
+        return self.y
+
+    @top.setter
+    def top(self, value):
+        self.y = value
+
+    @property
+    def bottom(self):
+        return self.y + self._h
+
+    @bottom.setter
+    def bottom(self, value):
+        self.y = _round_coord(value) - self._h
+
+    @property
+    def centerx(self):
+        return self.x + self._w // 2
+
+    @centerx.setter
+    def centerx(self, value):
+        self.x = _round_coord(value) - self._w // 2
+
+    @property
+    def centery(self):
+        return self.y + self._h // 2
+
+    @centery.setter
+    def centery(self, value):
+        self.y = _round_coord(value) - self._h // 2
+
+    @property
+    def topleft(self):
+        return (self.x, self.y)
+
+    @property
+    def topright(self):
+        return (self.x + self._w, self.y)
+
+    @property
+    def bottomleft(self):
+        return (self.x, self.y + self._h)
+
+    @property
+    def bottomright(self):
+        return (self.x + self._w, self.y + self._h)
+
+    @property
+    def center(self):
+        return (self.centerx, self.centery)
+
+def _sweep_box(x, y, w, h, vx, vy, other):
+    """Time of impact and axis ("x", "y" or "xy") of a moving box against a static rect, or None."""
+    ox, oy, ow, oh = other.x, other.y, other.width, other.height
+    if vx > 0:
+        tx0 = (ox - x - w) / vx
+        tx1 = (ox + ow - x) / vx
+    elif vx < 0:
+        tx0 = (ox + ow - x) / vx
+        tx1 = (ox - x - w) / vx
+    elif x + w <= ox or x >= ox + ow:
+        return None
+    else:
+        tx0, tx1 = float("-inf"), float("inf")
+    if vy > 0:
+        ty0 = (oy - y - h) / vy
+        ty1 = (oy + oh - y) / vy
+    elif vy < 0:
+        ty0 = (oy + oh - y) / vy
+        ty1 = (oy - y - h) / vy
+    elif y + h <= oy or y >= oy + oh:
+        return None
+    else:
+        ty0, ty1 = float("-inf"), float("inf")
+
+    t0 = max(tx0, ty0)
+    if t0 >= min(tx1, ty1) or min(tx1, ty1) <= 0:
+        return None
+    if tx0 == ty0:
+        return t0, "xy"
+    return t0, ("x" if tx0 > ty0 else "y")
+
+# ---------------------------- CLASSES ----------------------------
+class Paddle:
+    def __init__(self, x, y):
+        self.rect = Rect(x, y, PADDLE_WIDTH, PADDLE_HEIGHT)
+        self.x = float(self.rect.x)  # Sub-pixel x, so fractional-tick moves add up
+
+    def move(self, dx):
+        if _round_coord(self.x) != self.rect.x:
+            self.x = float(self.rect.x)  # Moved directly through the rect
+        # Keep the paddle inside the game area
+        self.x = min(max(self.x + dx, 0.0), float(GAME_WIDTH - self.rect.width))
+        self.rect.x = self.x
+
+# choice([0, -1, 1]) * randint(0, 2) as a single draw
+AI_JITTER = (0, 0, 0, 0, 0, -1, 1, -2, 2)
+
+class AIPaddle(Paddle):
+    def __init__(self, x, y):
+        super().__init__(x, y)
+
+    def update(self, balls, ticks=1):
+        """Track the closest ball with a little jitter; ticks > 1 extrapolates the balls along their velocity."""
+        if not balls:
+            return
+        rect = self.rect
+        centery = rect.centery
+        half_width = rect.width // 2
+        max_x = GAME_WIDTH - rect.width
+        x = rect.x
+        tracks = []
+        for ball in balls:
+            bx, by = ball.position()
+            tracks.append((bx, by, ball.vx, ball.vy, ball.rect.width // 2, ball.rect.height // 2))
+
+        for tick in range(ticks):
+            # Closest ball (vertically) at this tick
+            best = None
+            for bx, by, vx, vy, half_w, half_h in tracks:
+                distance = abs(_round_coord(by + vy * tick) + half_h - centery)
+                if best is None or distance < best:
+                    best = distance
+                    ball_x = _round_coord(bx + vx * tick) + half_w
+            # Add random jitter to AI movement
+            jitter = random.choice(AI_JITTER)
+            if ball_x + jitter < x + half_width:
+                x = max(x - PADDLE_SPEED, 0)
+            elif ball_x + jitter > x + half_width:
+                x = min(x + PADDLE_SPEED, max_x)
+            # Occasionally move randomly even if aligned
+            if random.random() < 0.05:
+                x = min(max(x + random.choice([-PADDLE_SPEED, PADDLE_SPEED]), 0), max_x)
+        rect.x = x
+        self.x = float(x)
+
+# Update the Ball class for better physics
+class Ball:
+    def __init__(self, x, y, vy_direction):
+        self.rect = Rect(x - BALL_RADIUS, y - BALL_RADIUS, BALL_RADIUS * 2, BALL_RADIUS * 2)
+        self.vx = random.choice([-1, 1]) * INITIAL_BALL_SPEED
+        self.vy = vy_direction * INITIAL_BALL_SPEED
+        self.trail = []  # Store previous positions for trail effect
+        self.last_hit_by = "player" if vy_direction < 0 else "ai"  # Track who last hit the ball
+        # Sub-pixel position; rect holds the rounded copy used for drawing and overlap tests
+        self.pos = (float(self.rect.x), float(self.rect.y))
+
+    def position(self):
+        """Sub-pixel top-left, falling back to the rect if something moved it directly."""
+        x, y = self.pos
+        if _round_coord(x) != self.rect.x or _round_coord(y) != self.rect.y:
+            return float(self.rect.x), float(self.rect.y)
+        return x, y
+
+    def set_position(self, x, y):
+        self.pos = (x, y)
+        self.rect.x = x
+        self.rect.y = y
+
+    def update(self):
+        # Store current position for trail; movement itself is swept by GameCore
+        self.trail.append((self.rect.centerx, self.rect.centery))
+        if len(self.trail) > 5:  # Limit trail length
+            self.trail.pop(0)
+
+    def clamp_speed(self):
+        # Limit maximum speed
+        self.vx, self.vy = self.clamped_velocity()
+
+    def clamped_velocity(self):
+        """(vx, vy) limited to the maximum speed, leaving the ball as it is."""
+        max_speed = INITIAL_BALL_SPEED * 2.5
+        vx, vy = self.vx, self.vy
+        if abs(vx) > max_speed:
+            vx = max_speed if vx > 0 else -max_speed
+        if abs(vy) > max_speed:
+            vy = max_speed if vy > 0 else -max_speed
+        return vx, vy
+
+# Update the Brick class to include special types
+class Brick:
+    def __init__(self, x, y, brick_type):
+        self.rect = Rect(x, y, BRICK_WIDTH, BRICK_HEIGHT)
+        self.type = brick_type
+        self.velocity = [0, 0]  # For moving bricks
+
+        if brick_type == 1:
+            self.hits = 1
+            self.color = BLUE
+        elif brick_type == 2:
+            self.hits = 3
+            self.color = RED
+        elif brick_type == 3:
+            self.hits = -1  # unbreakable
+            self.color = GRAY
+        elif brick_type == 4:  # Boss brick
+            self.hits = 10  # Will be overridden
+            self.color = (255, 215, 0)  # Gold
+        elif brick_type == 5:  # Moving brick
+            self.hits = 2
+            self.color = (0, 255, 128)  # Teal
+            self.velocity = [random.choice([-1, 1]) * 2, 0]  # Horizontal movement
+
+    def update(self, dt=1):
+        # For moving bricks
+        if self.type == 5:
+            self.rect.x += self.velocity[0] * dt
+            # Bounce off walls
+            if self.rect.left <= 0:
+                self.velocity[0] = abs(self.velocity[0])  # Ensure positive velocity
+                self.rect.left = 0  # Explicitly position at left boundary
+            elif self.rect.right >= GAME_WIDTH:
+                self.velocity[0] = -abs(self.velocity[0])  # Ensure negative velocity
+                self.rect.right = GAME_WIDTH  # Explicitly position at right boundary
+
+    def hit(self):
+        if self.hits > 0:
+            self.hits -= 1
+            if self.hits == 0:
+                return True  # Brick should be removed.
+            else:
+                # Darken the color a little to indicate damage.
+                self.color = (
+                    max(self.color[0]-30, 0),
+                    max(self.color[1]-30, 0),
+                    max(self.color[2]-30, 0)
+                )
+                # Boss bricks change color more dramatically
+                if self.type == 4:
+                    self.color = (
+                        255,  # Keep red high
+                        max(self.color[1]-50, 0),  # Reduce green
+                        min(self.color[2]+50, 255)  # Increase blue
+                    )
+        return False
+
+# Update the PowerUp class
+class PowerUp:
+    def __init__(self, x, y, direction="down"):
+        self.rect = Rect(x - 15, y - 15, 30, 30)
+        self.y = float(self.rect.y)  # Sub-pixel y for fractional-tick steps
+        # Update powerup types: replaced "life" with "score"
+        self.type = random.choice(["speed", "size", "multi", "score", "laser", "slow"])
+        self.vy = 2 if direction == "down" else -2  # Direction of movement
+        self.direction = direction  # "down" (toward player) or "up" (toward AI)
+        self.pulse = 0  # For pulsing effect
+        self.pulse_dir = 1
+
+        # Determine color based on type
+        self.color = POWERUP_COLORS[self.type]
+
+    def update(self, dt=1):
+        if _round_coord(self.y) != self.rect.y:
+            self.y = float(self.rect.y)
+        self.y += self.vy * dt
+        self.rect.y = self.y
+        # Pulsing effect
+        self.pulse += 0.1 * self.pulse_dir * dt
+        if self.pulse >= 1.0 or self.pulse <= 0.0:
+            self.pulse_dir *= -1
+
+    def apply(self, game, collector="player"):
+        """Apply this power-up to the simulation; presentation is left to game.events consumers."""
+        # Initialize extra lives and scores
+        extra_player_lives = 0
+        extra_ai_lives = 0
+        score_bonus = 0
+
+        player_paddle = game.player_paddle
+        ai_paddle = game.ai_paddle
+        balls = game.balls
+
+        if self.type == "speed":
+            # Increase ball speed
+            for ball in balls:
+                ball.vx *= 1.1
+                ball.vy *= 1.1
+        elif self.type == "size":
+            # Increase paddle size of the collector only
+            if collector == "player":
+                player_paddle.rect.width = min(PADDLE_WIDTH * 2, player_paddle.rect.width * 1.2)
+            else:
+                ai_paddle.rect.width = min(PADDLE_WIDTH * 2, ai_paddle.rect.width * 1.2)
+        elif self.type == "multi":
+            # Add a new ball
+            if balls:
+                new_ball = Ball(balls[0].rect.centerx, balls[0].rect.centery,
+                              -1 if collector == "player" else 1)
+                new_ball.last_hit_by = collector
+                balls.append(new_ball)
+        elif self.type == "score":
+            # Add score bonus (replaces life powerup)
+            score_bonus = 20  # 20 points bonus
+        elif self.type == "laser":
+            # Enhanced laser effect that destroys bricks in its path
+            laser_x = player_paddle.rect.centerx if collector == "player" else ai_paddle.rect.centerx
+            laser_y_start = player_paddle.rect.top if collector == "player" else ai_paddle.rect.bottom
+
+            # Destroy bricks in the laser's path
+            laser_width = 20  # Width of the effective laser beam
+            destroyed = []
+
+            # Only the lattice columns under the beam can be hit
+            reach = laser_width + BRICK_WIDTH
+            for brick in game.brick_grid.query_columns(laser_x - reach, laser_x + reach):
+                # If the laser passes through this brick
+                if abs(brick.rect.centerx - laser_x) < laser_width + brick.rect.width // 2:
+                    game.remove_brick(brick)
+                    game.record_brick_broken(brick, collector)
+                    destroyed.append(brick)
+
+            game.events.push(EVENT_LASER, side_code(collector), destroyed, (laser_x, laser_y_start))
+
+        elif self.type == "slow":
+            # Slow down balls temporarily
+            for ball in balls:
+                ball.vx *= 0.7
+                ball.vy *= 0.7
+
+        return extra_player_lives, extra_ai_lives, score_bonus
+
+# ---------------------------- HELPER FUNCTIONS ----------------------------
+# Update the create_bricks function for more interesting layouts:
+
+def create_bricks(level=1, rng=random):
+    """Brick list for a level; pass a random.Random as rng for a reproducible layout."""
+    bricks = []
+    offset_x = BRICK_OFFSET_X
+    offset_y = BRICK_OFFSET_Y
+
+    # Different patterns based on level
+    layout_type = level % 5  # 5 different layouts
+
+    if layout_type == 0:  # Standard pattern
+        for row in range(BRICK_ROWS):
+            for col in range(BRICK_COLS):
+                if rng.random() < 0.85:  # Higher chance to create a brick
+                    x = offset_x + col * (BRICK_WIDTH + BRICK_GAP)
+                    y = offset_y + row * (BRICK_HEIGHT + BRICK_GAP)
+                    # Higher levels = more tough bricks
+                    weights = [max(50 - level * 5, 10), 30 + level * 2, 20 + level]
+                    brick_type = rng.choices([1, 2, 3], weights=weights)[0]
+                    bricks.append(Brick(x, y, brick_type))
+
+    elif layout_type == 1:  # Checkerboard pattern
+        for row in range(BRICK_ROWS):
+            for col in range(BRICK_COLS):
+                if (row + col) % 2 == 0:
+                    x = offset_x + col * (BRICK_WIDTH + BRICK_GAP)
+                    y = offset_y + row * (BRICK_HEIGHT + BRICK_GAP)
+
+                    # Make sure outer edge bricks are always breakable
+                    if row == 0 or row == BRICK_ROWS-1 or col == 0 or col == BRICK_COLS-1:
+                        brick_type = rng.choices([1, 2], weights=[70, 30])[0]  # Only breakable types
+                    else:
+                        # Inner bricks can sometimes be unbreakable, but with reduced chance
+                        brick_type = rng.choices([1, 2, 3], weights=[50, 40, 10])[0]
+
+                    bricks.append(Brick(x, y, brick_type))
+
+    elif layout_type == 2:  # Fortress pattern with more unbreakable bricks
+        for row in range(BRICK_ROWS):
+            for col in range(BRICK_COLS):
+                if row == 0 or row == BRICK_ROWS-1 or col == 0 or col == BRICK_COLS-1:
+                    # Create border of tough but always breakable bricks
+                    x = offset_x + col * (BRICK_WIDTH + BRICK_GAP)
+                    y = offset_y + row * (BRICK_HEIGHT + BRICK_GAP)
+                    # Make sure there's at least one breakable brick on each side
+                    if (row == 0 and col == BRICK_COLS//2) or \
+                       (row == BRICK_ROWS-1 and col == BRICK_COLS//2) or \
+                       (col == 0 and row == BRICK_ROWS//2) or \
+                       (col == BRICK_COLS-1 and row == BRICK_ROWS//2):
+                        brick_type = 1  # Always easy breakable brick as entry point
+                    else:
+                        # Other border bricks - still mostly breakable
+                        brick_type = rng.choices([1, 2, 3], weights=[20, 60, 20])[0]
+                    bricks.append(Brick(x, y, brick_type))
+                elif rng.random() < 0.6:  # Interior bricks
+                    x = offset_x + col * (BRICK_WIDTH + BRICK_GAP)
+                    y = offset_y + row * (BRICK_HEIGHT + BRICK_GAP)
+                    brick_type = rng.choices([1, 2], weights=[70, 30])[0]
+                    bricks.append(Brick(x, y, brick_type))
+
+    elif layout_type == 3:  # Triangle pattern
+        for row in range(BRICK_ROWS):
+            for col in range(BRICK_COLS):
+                if col >= (BRICK_COLS - row - 1) // 2 and col < (BRICK_COLS + row + 1) // 2:
+                    x = offset_x + col * (BRICK_WIDTH + BRICK_GAP)
+                    y = offset_y + row * (BRICK_HEIGHT + BRICK_GAP)
+                    brick_type = rng.choices([1, 2, 3], weights=[50, 30, 20])[0]
+                    bricks.append(Brick(x, y, brick_type))
+
+    else:  # Circular pattern
+        center_col = BRICK_COLS // 2
+        center_row = BRICK_ROWS // 2
+        max_radius = min(BRICK_COLS, BRICK_ROWS) // 2
+
+        for row in range(BRICK_ROWS):
+            for col in range(BRICK_COLS):
+                # Calculate distance from center
+                dx = col - center_col
+                dy = row - center_row
+                distance = ((dx ** 2) + (dy ** 2)) ** 0.5
+
+                if distance <= max_radius:
+                    x = offset_x + col * (BRICK_WIDTH + BRICK_GAP)
+                    y = offset_y + row * (BRICK_HEIGHT + BRICK_GAP)
+                    # Bricks get tougher toward center
+                    if distance <= max_radius / 3:  # Inner circle
+                        brick_type = 3
+                    elif distance <= max_radius * 2/3:  # Middle circle
+                        brick_type = 2
+                    else:  # Outer circle
+                        brick_type = 1
+                    bricks.append(Brick(x, y, brick_type))
+
+    # Add special "boss" brick for higher levels
+    if level > 3 and level % 3 == 0:
+        x = offset_x + (BRICK_COLS // 2) * (BRICK_WIDTH + BRICK_GAP)
+        y = offset_y + (BRICK_ROWS // 2) * (BRICK_HEIGHT + BRICK_GAP)
+        boss_brick = Brick(x, y, 4)  # New brick type 4 for boss brick
+        boss_brick.hits = level * 2  # More hits based on level
+        boss_brick.color = (255, 215, 0)  # Gold color
+        boss_brick.rect.width *= 2  # Double width
+        bricks.append(boss_brick)
+
+    return bricks
+
+# ---------------------------- SPATIAL INDEX ----------------------------
+class BrickGrid:
+    """
+    Broadphase for ball-vs-brick tests on the create_bricks lattice; off-lattice bricks go in `overflow`.
+    Queries return bricks in brick-list order, so the first brick hit wins as in a linear scan.
+    """
+
+    def __init__(self, bricks):
+        self.cells = [None] * (BRICK_ROWS * BRICK_COLS)
+        self.overflow = []
+        self.order = {}    # brick -> position in the original list
+        self.cell_of = {}  # brick -> lattice cell index, or None for overflow
+        # Same as add() for each brick, unrolled since this runs on every level reset
+        cells = self.cells
+        for index, brick in enumerate(bricks):
+            self.order[brick] = index
+            cell = self._lattice_cell(brick)
+            self.cell_of[brick] = cell
+            if cell is None:
+                self.overflow.append(brick)
+            else:
+                cells[cell] = brick
+        self.next_index = len(bricks)
+
+    def _lattice_cell(self, brick):
+        rect = brick.rect
+        if brick.type == 5 or rect.width != BRICK_WIDTH or rect.height != BRICK_HEIGHT:
+            return None
+        col, dx = divmod(rect.x - BRICK_OFFSET_X, BRICK_PITCH_X)
+        row, dy = divmod(rect.y - BRICK_OFFSET_Y, BRICK_PITCH_Y)
+        if dx or dy or not (0 <= col < BRICK_COLS and 0 <= row < BRICK_ROWS):
+            return None
+        cell = row * BRICK_COLS + col
+        if self.cells[cell] is not None:
+            return None  # Cell already taken, keep the newcomer in the overflow
+        return cell
+
+    def add(self, brick, index=None):
+        if index is None:
+            index = self.next_index
+        self.next_index = max(self.next_index, index + 1)
+        self.order[brick] = index
+        cell = self._lattice_cell(brick)
+        self.cell_of[brick] = cell
+        if cell is None:
+            self.overflow.append(brick)
+        else:
+            self.cells[cell] = brick
+
+    def remove(self, brick):
+        """Drop a destroyed brick from the index."""
+        del self.order[brick]
+        cell = self.cell_of.pop(brick)
+        if cell is None:
+            self.overflow.remove(brick)
+        else:
+            self.cells[cell] = None
+
+    def _sorted(self, found):
+        if len(found) > 1:
+            found.sort(key=self.order.__getitem__)
+        return found
+
+    def query(self, left, top, right, bottom):
+        """Bricks that may overlap the box [left, right) x [top, bottom)."""
+        found = list(self.overflow)
+        col0 = max((left - BRICK_OFFSET_X) // BRICK_PITCH_X, 0)
+        col1 = min((right - 1 - BRICK_OFFSET_X) // BRICK_PITCH_X, BRICK_COLS - 1)
+        row0 = max((top - BRICK_OFFSET_Y) // BRICK_PITCH_Y, 0)
+        row1 = min((bottom - 1 - BRICK_OFFSET_Y) // BRICK_PITCH_Y, BRICK_ROWS - 1)
+        cells = self.cells
+        for row in range(row0, row1 + 1):
+            base = row * BRICK_COLS
+            for col in range(col0, col1 + 1):
+                brick = cells[base + col]
+                if brick is not None:
+                    found.append(brick)
+        return self._sorted(found)
+
+    def query_columns(self, left, right):
+        """Bricks in every lattice column overlapping [left, right), plus the overflow."""
+        found = list(self.overflow)
+        col0 = max((left - BRICK_OFFSET_X) // BRICK_PITCH_X, 0)
+        col1 = min((right - 1 - BRICK_OFFSET_X) // BRICK_PITCH_X, BRICK_COLS - 1)
+        cells = self.cells
+        for col in range(col0, col1 + 1):
+            for cell in range(col, BRICK_ROWS * BRICK_COLS, BRICK_COLS):
+                if cells[cell] is not None:
+                    found.append(cells[cell])
+        return self._sorted(found)
+
+# ---------------------------- LEVEL CACHE ----------------------------
+# A layout is an array("h") holding LAYOUT_STRIDE shorts per brick: type, x, y, width, hits, vx
+LAYOUT_STRIDE = 6
+LEVEL_PACK_MAGIC = b"BPLVLPK1"
+
+def layout_from_bricks(bricks):
+    layout = array("h")
+    for brick in bricks:
+        layout.extend((brick.type, brick.rect.x, brick.rect.y, brick.rect.width, brick.hits, brick.velocity[0]))
+    return layout
+
+def bricks_from_layout(layout):
+    """Fresh Brick objects for a layout, without Brick.__init__ or any random draws."""
+    bricks = []
+    new = object.__new__
+    set_slot = object.__setattr__  # Layout values are already whole pixels, skip Rect's rounding
+    fields = [layout[i::LAYOUT_STRIDE] for i in range(LAYOUT_STRIDE)]
+    for brick_type, x, y, width, hits, vx in zip(*fields):
+        rect = new(Rect)
+        set_slot(rect, "x", x)
+        set_slot(rect, "y", y)
+        set_slot(rect, "_w", width)
+        set_slot(rect, "_h", BRICK_HEIGHT)
+        brick = new(Brick)
+        brick.rect = rect
+        brick.type = brick_type
+        brick.hits = hits
+        brick.color = BRICK_COLORS[brick_type]
+        brick.velocity = [vx, 0]
+        bricks.append(brick)
+    return bricks
+
+def generate_layout(level, seed):
+    """The layout create_bricks builds for (level, seed); the same pair always gives the same bricks."""
+    return layout_from_bricks(create_bricks(level, random.Random(f"{level}:{seed}")))
+
+def build_level_pack(path, levels, seeds):
+    """Pregenerate the layout of every (level, seed) pair into a level pack file for LevelCache."""
+    index = {}
+    blobs = []
+    offset = 0
+    for level in levels:
+        for seed in seeds:
+            data = generate_layout(level, seed).tobytes()
+            index[f"{level}:{seed}"] = [offset, len(data)]
+            blobs.append(data)
+            offset += len(data)
+    # Magic, header length, JSON header (index and byte order), then the raw layouts
+    header = json.dumps({"byteorder": sys.byteorder, "layouts": index}).encode()
+    with open(path, "wb") as f:
+        f.write(LEVEL_PACK_MAGIC + struct.pack("<Q", len(header)) + header)
+        for data in blobs:
+            f.write(data)
+
+class LevelCache:
+    """Bounded LRU of brick layouts keyed on (level, seed), read from a level pack or generated."""
+
+    def __init__(self, max_layouts=512, pack_path=None):
+        self.max_layouts = max_layouts
+        self.layouts = OrderedDict()
+        self.pack_path = pack_path
+        self.pack_index = {}
+        self.pack_data_start = 0
+        self.pack_swap = False  # Pack written on a machine with the other byte order
+        self.hits = 0
+        self.misses = 0
+        if pack_path is not None:
+            self._read_pack_header()
+
+    def _read_pack_header(self):
+        with open(self.pack_path, "rb") as f:
+            if f.read(len(LEVEL_PACK_MAGIC)) != LEVEL_PACK_MAGIC:
+                raise ValueError(f"{self.pack_path!r} is not a level pack")
+            (size,) = struct.unpack("<Q", f.read(8))
+            header = json.loads(f.read(size))
+        self.pack_index = header["layouts"]
+        self.pack_swap = header["byteorder"] != sys.byteorder
+        self.pack_data_start = len(LEVEL_PACK_MAGIC) + 8 + size
+
+    def _read_from_pack(self, key):
+        entry = self.pack_index.get(key)
+        if entry is None:
+            return None
+        offset, size = entry
+        with open(self.pack_path, "rb") as f:
+            f.seek(self.pack_data_start + offset)
+            layout = array("h", f.read(size))
+        if self.pack_swap:
+            layout.byteswap()
+        return layout
+
+    def layout(self, level, seed):
+        key = f"{level}:{seed}"
+        layout = self.layouts.get(key)
+        if layout is not None:
+            self.layouts.move_to_end(key)
+            self.hits += 1
+            return layout
+        self.misses += 1
+        layout = self._read_from_pack(key)
+        if layout is None:
+            layout = generate_layout(level, seed)
+        self.layouts[key] = layout
+        if len(self.layouts) > self.max_layouts:
+            self.layouts.popitem(last=False)  # Least recently used
+        return layout
+
+    def bricks(self, level, seed):
+        return bricks_from_layout(self.layout(level, seed))
+
+_shared_level_caches = {}
+
+def shared_level_cache(pack_path=None):
+    """One LevelCache per pack path for the whole process, so every env shares its layouts."""
+    cache = _shared_level_caches.get(pack_path)
+    if cache is None:
+        cache = _shared_level_caches[pack_path] = LevelCache(pack_path=pack_path)
+    return cache
+
+# ---------------------------- CLOCKS ----------------------------
+def _wall_clock_ms():
+    return int(time.monotonic() * 1000)
+
+class SimClock:
+    """Simulated milliseconds, advanced by the ticks GameCore simulates."""
+
+    def __init__(self, start_ms=0):
+        self.ms = start_ms
+
+    def now(self):
+        return self.ms
+
+    def advance(self, ticks):
+        # One tick is one 60 FPS frame
+        self.ms += ticks * 1000 / FPS
+
+    def advance_ms(self, ms):
+        self.ms += ms
+
+class RealTimeClock:
+    """SimClock interface over a real millisecond source; advance() does nothing."""
+
+    def __init__(self, source=None):
+        self.source = source or _wall_clock_ms
+
+    def now(self):
+        return self.source()
+
+    def advance(self, ticks):
+        pass
+
+    def advance_ms(self, ms):
+        pass
+
+# ---------------------------- EVENTS ----------------------------
+def side_code(name):
+    return SIDE_PLAYER if name == "player" else SIDE_AI
+
+class EventRing:
+    """
+    Preallocated ring of typed events (kind, side, subject, value) from the last GameCore step.
+    Walk it with events.slots(); iterating yields the older tuple form.
+    """
+
+    def __init__(self, capacity=EVENT_CAPACITY):
+        self._allocate(capacity)
+        self.start = 0  # Running index of the first event of the current step
+        self.end = 0    # Running index one past the last event written
+
+    def _allocate(self, capacity):
+        self.mask = capacity - 1
+        self.kind = array("b", [-1]) * capacity           # EVENT_* code
+        self.side = array("b", [SIDE_NONE]) * capacity    # Paddle, breaker, loser or collector
+        self.subject = [None] * capacity                  # Ball, brick or power-up; a laser's destroyed bricks
+        self.value = [None] * capacity                    # Hitting ball, score bonus or laser (x, y_start)
+
+    def begin(self):
+        """Start a new step: earlier events are dropped (their slots get reused)."""
+        self.start = self.end
+
+    def push(self, kind, side=SIDE_NONE, subject=None, value=None):
+        """Write one event and return its running index (see set_value)."""
+        if self.end - self.start > self.mask:
+            self._grow()
+        i = self.end & self.mask
+        self.kind[i] = kind
+        self.side[i] = side
+        self.subject[i] = subject
+        self.value[i] = value
+        self.end += 1
+        return self.end - 1
+
+    def set_value(self, index, value):
+        """Fill in the value of an event pushed earlier this step, by running index."""
+        self.value[index & self.mask] = value
+
+    def _grow(self):
+        # Only the current step's events are live; copy them into a ring twice the size
+        live = [(self.kind[j & self.mask], self.side[j & self.mask], self.subject[j & self.mask],
+                 self.value[j & self.mask]) for j in range(self.start, self.end)]
+        self._allocate(2 * (self.mask + 1))
+        for j, (kind, side, subject, value) in enumerate(live, self.start):
+            i = j & self.mask
+            self.kind[i], self.side[i], self.subject[i], self.value[i] = kind, side, subject, value
+
+    def slots(self):
+        """Slot indices of the current step's events, oldest first."""
+        mask = self.mask
+        return [j & mask for j in range(self.start, self.end)]
+
+    def count(self, kind, side=None):
+        """How many of the current step's events are of this kind (and side)."""
+        n = 0
+        for i in self.slots():
+            if self.kind[i] == kind and (side is None or self.side[i] == side):
+                n += 1
+        return n
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __bool__(self):
+        return self.end > self.start
+
+    def __iter__(self):
+        for i in self.slots():
+            yield self.as_tuple(i)
+
+    def as_tuple(self, i):
+        """Slot i in the tuple form listed under EVENT_NAMES."""
+        kind, side, subject, value = self.kind[i], self.side[i], self.subject[i], self.value[i]
+        side_name = SIDE_NAMES[side] if side >= 0 else None
+        if kind == EVENT_PADDLE_HIT or kind == EVENT_BALL_LOST:
+            return (EVENT_NAMES[kind], side_name, subject)
+        if kind == EVENT_BRICK_HIT:
+            return ("brick_hit", subject, value)
+        if kind == EVENT_BRICK_BROKEN:
+            return ("brick_broken", subject, side_name)
+        if kind == EVENT_POWERUP_COLLECTED:
+            return ("powerup_collected", subject, side_name, value)
+        if kind == EVENT_LASER:
+            return ("laser", value[0], value[1], side_name, subject)
+        return (EVENT_NAMES[kind],)
+
+# ---------------------------- SCORING ----------------------------
+class SideLedger:
+    """Running round totals for one side, updated once per brick broken or ball lost."""
+
+    def __init__(self):
+        self.brick_stats = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}  # Bricks broken by type
+        self.bricks_broken = 0
+        self.brick_points = 0
+        self.balls_lost = 0
+        self.ball_penalty = 0
+
+    def record_brick(self, brick_type):
+        self.brick_stats[brick_type] = self.brick_stats.get(brick_type, 0) + 1
+        self.bricks_broken += 1
+        self.brick_points += BRICK_POINTS.get(brick_type, 0)
+
+    def record_ball_lost(self):
+        self.balls_lost += 1
+        self.ball_penalty = min(MAX_BALL_PENALTY, self.ball_penalty + max(0, 6 - self.balls_lost))
+
+    @property
+    def round_score(self):
+        return max(0, self.brick_points - self.ball_penalty)
+
+class ScoreLedger:
+    """Running round statistics for both sides, fed each step's events through consume()."""
+
+    def __init__(self, bricks):
+        self.player = SideLedger()
+        self.ai = SideLedger()
+        self.sides = (self.player, self.ai)  # Indexed by side code
+        self.breakable_total = sum(1 for brick in bricks if brick.hits > 0)
+        self.breakable_left = self.breakable_total
+
+    def side(self, name):
+        return self.player if name == "player" else self.ai
+
+    def consume(self, events):
+        """Fold the brick_broken and ball_lost events of a step into the totals."""
+        kinds, sides, subjects = events.kind, events.side, events.subject
+        for i in events.slots():
+            kind = kinds[i]
+            if kind == EVENT_BRICK_BROKEN:
+                brick = subjects[i]
+                self.sides[sides[i]].record_brick(brick.type)
+                # Unbreakable bricks (hits == -1) only go away to lasers and were never counted
+                if brick.hits >= 0:
+                    self.breakable_left -= 1
+            elif kind == EVENT_BALL_LOST:
+                self.sides[sides[i]].record_ball_lost()
+
+# ---------------------------- SIMULATION CORE ----------------------------
+class GameCore:
+    """
+    Headless Brick Pong simulation shared by the interactive game and the gym env.
+    step() returns the EventRing of that step; consumers registered with subscribe() see it too.
+    """
+
+    def __init__(self, level=1, clock=None, level_cache=None):
+        # All timers read this clock; step() advances it by the simulated ticks
+        self.clock = clock if clock is not None else SimClock()
+        # Seeded resets (reset_level(level, layout_seed)) take their bricks from here
+        self.level_cache = level_cache if level_cache is not None else shared_level_cache()
+        self.ticks = 0  # Simulated ticks since creation
+        self.player_paddle = Paddle((GAME_WIDTH - PADDLE_WIDTH) // 2, SCREEN_HEIGHT - 60)
+        self.ai_paddle = AIPaddle((GAME_WIDTH - PADDLE_WIDTH) // 2, 40)
+        self.score = 0
+        self.events = EventRing()
+        self.consumers = []  # Called with the EventRing after every step
+        self.reset_level(level)
+
+    def reset_level(self, level=None, layout_seed=None):
+        """Start a round; with a layout_seed the bricks come from the level cache, reproducibly."""
+        if level is not None:
+            self.level = level
+
+        self.power_ups = []
+        self.player_paddle.rect.width = PADDLE_WIDTH
+        self.ai_paddle.rect.width = PADDLE_WIDTH
+
+        # Spawn one ball for the player (above the paddle, going upward)
+        # and one for the AI (below the paddle, going downward)
+        self.balls = [
+            Ball(self.player_paddle.rect.centerx, self.player_paddle.rect.top - 20, -1),
+            Ball(self.ai_paddle.rect.centerx, self.ai_paddle.rect.bottom + 20, 1),
+        ]
+        self.last_ball_mult_time = self.clock.now()
+
+        # Create bricks with level-specific patterns
+        if layout_seed is None:
+            self.bricks = create_bricks(self.level)
+        else:
+            self.bricks = self.level_cache.bricks(self.level, layout_seed)
+        self.brick_grid = BrickGrid(self.bricks)
+
+        # Fresh round stats, including the breakable-brick count
+        self.ledger = ScoreLedger(self.bricks)
+
+        # Reset level timer
+        self.level_reset_timer = 0
+        self.level_reset_active = False
+
+        # None while the round is in progress, otherwise why it ended:
+        # "balls_lost", "cleared" or "timer"
+        self.round_over = None
+        self.events.begin()
+
+    def remove_brick(self, brick):
+        self.bricks.remove(brick)
+        self.brick_grid.remove(brick)
+
+    def record_brick_broken(self, brick, breaker):
+        self.events.push(EVENT_BRICK_BROKEN, side_code(breaker), brick)
+
+    def subscribe(self, consumer):
+        """Call consumer(events) with the EventRing after every step (sounds, effects, ...)."""
+        self.consumers.append(consumer)
+
+    def unsubscribe(self, consumer):
+        self.consumers.remove(consumer)
+
+    # Round stats, read from the ledger
+    @property
+    def player_brick_stats(self):
+        return self.ledger.player.brick_stats
+
+    @property
+    def ai_brick_stats(self):
+        return self.ledger.ai.brick_stats
+
+    @property
+    def player_balls_lost(self):
+        return self.ledger.player.balls_lost
+
+    @property
+    def ai_balls_lost(self):
+        return self.ledger.ai.balls_lost
+
+    @property
+    def breakable_brick_count(self):
+        """Breakable bricks at the start of the round."""
+        return self.ledger.breakable_total
+
+    def ball_mult_remaining(self):
+        """Seconds until the next ball multiplication."""
+        return max(0, (BALL_MULT_INTERVAL - (self.clock.now() - self.last_ball_mult_time)) / 1000)
+
+    def level_advance_remaining(self):
+        """Whole seconds until the level advances, or None if the countdown isn't running."""
+        if not self.level_reset_active:
+            return None
+        return max(0, 30 - int(self.clock.now() - self.level_reset_timer) // 1000)
+
+    def step(self, player_action=ACTION_STAY, ai_action=None, dt=1):
+        """Advance dt ticks (may be fractional) with the actions held; ai_action=None uses the built-in AI."""
+        events = self.events
+        events.begin()
+        if self.round_over:
+            return events
+
+        # The AI decides once per whole tick, however finely the step is sliced
+        ai_ticks = int(self.ticks + dt) - int(self.ticks)
+        self.ticks += dt
+        self.clock.advance(dt)
+        current_time = self.clock.now()
+
+        # Cap ball speeds before anything reads them (the AI's lookahead, the sweep)
+        for ball in self.balls:
+            ball.clamp_speed()
+
+        # --- Paddles ---
+        if player_action == ACTION_LEFT:
+            self.player_paddle.move(-PADDLE_SPEED * dt)
+        elif player_action == ACTION_RIGHT:
+            self.player_paddle.move(PADDLE_SPEED * dt)
+
+        if ai_action is None:
+            self.ai_paddle.update(self.balls, ai_ticks)
+        elif ai_action == ACTION_LEFT:
+            self.ai_paddle.move(-PADDLE_SPEED * dt)
+        elif ai_action == ACTION_RIGHT:
+            self.ai_paddle.move(PADDLE_SPEED * dt)
+
+        self._update_balls(dt)
+
+        # --- Update Moving Bricks ---
+        for brick in self.brick_grid.overflow:
+            brick.update(dt)
+
+        self._update_power_ups(dt)
+
+        # --- Check Level Completion ---
+        if self.round_over is None and len(self.bricks) == 0:
+            self.level += 1
+            self.round_over = "cleared"
+
+        # --- Ball Multiplication ---
+        if current_time - self.last_ball_mult_time > BALL_MULT_INTERVAL and len(self.balls) < MAX_BALLS:
+            # For each current ball, spawn a new one with inverted x-velocity
+            new_balls = []
+            for ball in self.balls:
+                new_ball = Ball(ball.rect.centerx, ball.rect.centery, 1 if ball.vy > 0 else -1)
+                new_ball.vx = -ball.vx
+                new_ball.vy = ball.vy
+                new_balls.append(new_ball)
+            self.balls.extend(new_balls)
+            self.last_ball_mult_time = current_time
+
+        # Fold this step's bricks and balls into the round stats
+        ledger = self.ledger
+        if events:
+            ledger.consume(events)
+
+        # Check if 80% of breakable bricks are cleared
+        if not self.level_reset_active and ledger.breakable_total > 0:
+            if ledger.breakable_left <= 0.2 * ledger.breakable_total:
+                self.level_reset_active = True
+                self.level_reset_timer = current_time
+                events.push(EVENT_LEVEL_TIMER_STARTED)
+
+        # If timer is active, check if it's been 30 seconds
+        if self.level_reset_active and current_time - self.level_reset_timer >= LEVEL_ADVANCE_DELAY:
+            self.level_reset_active = False
+            if self.round_over is None:
+                self.level += 1
+                self.round_over = "timer"
+
+        for consumer in self.consumers:
+            consumer(events)
+        return events
+
+    def advance(self, player_action=ACTION_STAY, ai_action=None, max_ticks=MAX_ADVANCE_TICKS):
+        """Step straight to the next thing that matters (see ticks_until_event); returns (events, ticks)."""
+        dt = self.ticks_until_event(max_ticks)
+        return self.step(player_action, ai_action, dt), dt
+
+    def advance_until_decision(self, player_action=ACTION_STAY, ai_action=None, max_ticks=None):
+        """
+        Advance until a ball or power-up nears the player's paddle or the round ends; returns (events, ticks).
+        Returns ([], 0) without stepping when one is already within DECISION_TICKS, so call step() then.
+        """
+        events = []
+        elapsed = 0
+        while not self.round_over and (max_ticks is None or elapsed < max_ticks):
+            if self._ticks_to_player() <= DECISION_TICKS:
+                break
+            limit = MAX_ADVANCE_TICKS if max_ticks is None else min(MAX_ADVANCE_TICKS, max_ticks - elapsed)
+            dt = self.ticks_until_event(limit, player_window=DECISION_TICKS)
+            events.extend(self.step(player_action, ai_action, dt))
+            elapsed += dt
+        return events, elapsed
+
+    def ticks_until_event(self, max_ticks=MAX_ADVANCE_TICKS, player_window=PADDLE_WINDOW_TICKS):
+        """Ticks one step(dt) can cover without skipping an impact, a paddle approach or a timer."""
+        if any(brick.type == 5 for brick in self.brick_grid.overflow):
+            return 1  # Moving bricks aren't swept, so fall back to single ticks
+
+        limit = max_ticks
+        for ball in self.balls:
+            # A lookahead only: the speed cap step() will apply, without applying it
+            x, y = ball.position()
+            t, hit, _ = self._next_impact(ball, x, y, limit, velocity=ball.clamped_velocity())
+            if hit is not None:
+                limit = min(limit, max(1, math.ceil(t)))
+
+        # Stop short of the paddles; inside the windows go one tick at a time
+        for t, window in ((self._ticks_to_player(), player_window),
+                          (self._ticks_to_ai(), PADDLE_WINDOW_TICKS)):
+            if t <= window:
+                return 1
+            if t - window < limit:
+                limit = math.ceil(t - window)
+
+        # Timers (milliseconds) converted to ticks
+        ms_per_tick = 1000 / FPS
+        now = self.clock.now()
+        timer_ms = [BALL_MULT_INTERVAL - (now - self.last_ball_mult_time)]
+        if self.level_reset_active:
+            timer_ms.append(LEVEL_ADVANCE_DELAY - (now - self.level_reset_timer))
+        for ms in timer_ms:
+            limit = min(limit, max(1, math.ceil(ms / ms_per_tick)))
+        return max(1, int(limit))
+
+    def _ticks_to_player(self):
+        # Ticks until the first ball or power-up heading down reaches the player's paddle
+        top = self.player_paddle.rect.top
+        bottom = self.player_paddle.rect.bottom
+        soonest = float("inf")
+        for ball in self.balls:
+            if ball.vy > 0 and ball.rect.top < bottom:
+                soonest = min(soonest, (top - ball.rect.bottom) / ball.vy)
+        for power_up in self.power_ups:
+            if power_up.direction == "down" and power_up.rect.top <= bottom:
+                soonest = min(soonest, (top - power_up.rect.bottom) / power_up.vy)
+        return soonest
+
+    def _ticks_to_ai(self):
+        # Ticks until the first ball or power-up heading up reaches the AI's paddle
+        top = self.ai_paddle.rect.top
+        bottom = self.ai_paddle.rect.bottom
+        soonest = float("inf")
+        for ball in self.balls:
+            if ball.vy < 0 and ball.rect.bottom > top:
+                soonest = min(soonest, (ball.rect.top - bottom) / -ball.vy)
+        for power_up in self.power_ups:
+            if power_up.direction == "up" and power_up.rect.bottom >= top:
+                soonest = min(soonest, (power_up.rect.top - bottom) / -power_up.vy)
+        return soonest
+
+    def _update_balls(self, dt=1):
+        for ball in self.balls[:]:
+            ball.update()
+            self._move_ball(ball, dt)
+
+    def _move_ball(self, ball, dt):
+        """Sweep a ball through dt ticks, resolving impacts in time-of-impact order so nothing tunnels."""
+        player_rect = self.player_paddle.rect
+        ai_rect = self.ai_paddle.rect
+        rect = ball.rect
+        w, h = rect.width, rect.height
+        x, y = ball.position()
+        remaining = dt
+        last_hit = None
+
+        for _ in range(MAX_IMPACTS_PER_STEP):
+            vx, vy = ball.vx, ball.vy
+            t_hit, hit, axis = self._next_impact(ball, x, y, remaining, last_hit)
+
+            x += vx * t_hit
+            y += vy * t_hit
+            remaining -= t_hit
+            if hit is None:
+                break
+            last_hit = hit
+
+            if hit == "left":
+                x = 0.0
+                ball.vx = abs(vx)  # Ensure positive x velocity
+                # Add small random variation for bounces
+                ball.vx += random.uniform(-0.2, 0.2)
+            elif hit == "right":
+                x = float(GAME_WIDTH - w)
+                ball.vx = -abs(vx)  # Ensure negative x velocity
+                # Add small random variation for bounces
+                ball.vx += random.uniform(-0.2, 0.2)
+            elif hit == "ai_goal":
+                ball.set_position(x, y)
+                self._lose_ball(ball, "ai")
+                return
+            elif hit == "player_goal":
+                ball.set_position(x, y)
+                self._lose_ball(ball, "player")
+                return
+            elif hit is player_rect:
+                # Calculate angle based on where the ball hit the paddle
+                offset = (x + w / 2 - player_rect.centerx) / (player_rect.width / 2)
+                ball.vx = INITIAL_BALL_SPEED * offset * 1.5
+                ball.vy = -abs(vy)
+                # Reposition ball above paddle
+                y = float(player_rect.top - h)
+                ball.last_hit_by = "player"  # Set last hit by player
+                self.events.push(EVENT_PADDLE_HIT, SIDE_PLAYER, ball)
+            elif hit is ai_rect:
+                offset = (x + w / 2 - ai_rect.centerx) / (ai_rect.width / 2)
+                ball.vx = INITIAL_BALL_SPEED * offset * 1.5
+                ball.vy = abs(vy)
+                # Reposition ball below paddle
+                y = float(ai_rect.bottom)
+                ball.last_hit_by = "ai"  # Set last hit by AI
+                self.events.push(EVENT_PADDLE_HIT, SIDE_AI, ball)
+            else:
+                x, y = self._bounce_off_brick(ball, hit, axis, x, y)
+            ball.clamp_speed()
+
+        # Whatever happens, the ball ends the step inside the side walls
+        ball.set_position(min(max(x, 0.0), float(GAME_WIDTH - w)), y)
+
+    def _next_impact(self, ball, x, y, horizon, last_hit=None, velocity=None):
+        """Earliest (t, hit, axis) for a ball at (x, y) within horizon ticks, or (horizon, None, None)."""
+        player_rect = self.player_paddle.rect
+        ai_rect = self.ai_paddle.rect
+        w, h = ball.rect.width, ball.rect.height
+        vx, vy = velocity or (ball.vx, ball.vy)
+        t_hit, hit, axis = horizon, None, None
+
+        # Side walls and the two goal lines
+        if vx < 0 and last_hit != "left":
+            t = max(0.0, -x / vx)
+            if t <= t_hit:
+                t_hit, hit = t, "left"
+        elif vx > 0 and last_hit != "right":
+            t = max(0.0, (GAME_WIDTH - w - x) / vx)
+            if t <= t_hit:
+                t_hit, hit = t, "right"
+        if vy < 0:
+            t = max(0.0, -y / vy)
+            if t <= t_hit:
+                t_hit, hit = t, "ai_goal"
+        elif vy > 0:
+            t = max(0.0, (SCREEN_HEIGHT - h - y) / vy)
+            if t <= t_hit:
+                t_hit, hit = t, "player_goal"
+
+        # Paddles only catch a ball travelling toward them
+        if vy > 0 and last_hit is not player_rect:
+            impact = _sweep_box(x, y, w, h, vx, vy, player_rect)
+            if impact and impact[0] < t_hit:
+                t_hit, hit = max(0.0, impact[0]), player_rect
+        elif vy < 0 and last_hit is not ai_rect:
+            impact = _sweep_box(x, y, w, h, vx, vy, ai_rect)
+            if impact and impact[0] < t_hit:
+                t_hit, hit = max(0.0, impact[0]), ai_rect
+
+        # Bricks under the box swept up to the earliest hit so far
+        end_x, end_y = x + vx * t_hit, y + vy * t_hit
+        candidates = self.brick_grid.query(math.floor(min(x, end_x)), math.floor(min(y, end_y)),
+                                           math.ceil(max(x, end_x)) + w, math.ceil(max(y, end_y)) + h)
+        for brick in candidates:
+            if brick is last_hit:
+                continue
+            impact = _sweep_box(x, y, w, h, vx, vy, brick.rect)
+            if impact and impact[0] < t_hit:
+                t_hit, hit, axis = max(0.0, impact[0]), brick, impact[1]
+        return t_hit, hit, axis
+
+    def _bounce_off_brick(self, ball, brick, axis, x, y):
+        """Reflect a ball off the face of the brick it touched and return its new position."""
+        brick_rect = brick.rect
+        w, h = ball.rect.width, ball.rect.height
+        if axis in ("x", "xy"):
+            # Horizontal collision
+            x = float(brick_rect.left - w) if ball.vx > 0 else float(brick_rect.right)
+            ball.vx = -ball.vx
+        if axis in ("y", "xy"):
+            # Vertical collision
+            y = float(brick_rect.top - h) if ball.vy > 0 else float(brick_rect.bottom)
+            ball.vy = -ball.vy
+        self.events.push(EVENT_BRICK_HIT, SIDE_NONE, brick, ball)
+
+        if brick.hit():
+            # Update brick stats based on who hit the ball last
+            self.remove_brick(brick)
+            self.record_brick_broken(brick, ball.last_hit_by)
+            self.score += 10 * self.level  # Keep this for overall game scoring
+            # Chance to spawn power-up in the direction of the last player who hit the ball
+            if random.random() < 0.25:
+                direction = "down" if ball.last_hit_by == "player" else "up"
+                self.power_ups.append(PowerUp(brick_rect.centerx, brick_rect.centery, direction))
+        return x, y
+
+    def _lose_ball(self, ball, side):
+        self.balls.remove(ball)
+        self.events.push(EVENT_BALL_LOST, side_code(side), ball)
+        if len(self.balls) == 0 and self.round_over is None:
+            self.round_over = "balls_lost"
+
+    def _update_power_ups(self, dt=1):
+        for power_up in self.power_ups[:]:
+            prev_y = power_up.rect.y
+            power_up.update(dt)
+            # Test the whole stretch it fell through so big steps can't skip a paddle
+            swept = Rect(power_up.rect.x, min(prev_y, power_up.rect.y), power_up.rect.width,
+                         power_up.rect.height + abs(power_up.rect.y - prev_y))
+
+            # Check if power-up is collected by player
+            if swept.colliderect(self.player_paddle.rect) and power_up.direction == "down":
+                self._collect_power_up(power_up, "player")
+                continue
+
+            # Check if power-up is collected by AI
+            if swept.colliderect(self.ai_paddle.rect) and power_up.direction == "up":
+                self._collect_power_up(power_up, "ai")
+                continue
+
+            # Remove if off-screen
+            if (power_up.direction == "down" and power_up.rect.top > SCREEN_HEIGHT) or \
+               (power_up.direction == "up" and power_up.rect.bottom < 0):
+                self.power_ups.remove(power_up)
+
+    def _collect_power_up(self, power_up, collector):
+        self.power_ups.remove(power_up)
+        # Announce the pickup ahead of anything the power-up itself triggers
+        index = self.events.push(EVENT_POWERUP_COLLECTED, side_code(collector), power_up)
+        _, _, score_bonus = power_up.apply(self, collector)
+        self.events.set_value(index, score_bonus)
@@ -8,10 +8,13 @@ import multiprocessing
 from stable_baselines3 import DQN, PPO, A2C
 from sb3_contrib import QRDQN
 from stable_baselines3.common.evaluation import evaluate_policy
-from stable_baselines3.common.vec_env import DummyVecEnv
+from stable_baselines3.common.vec_env import DummyVecEnv, VecMonitor
 from stable_baselines3.common.monitor import Monitor
 
 from brickpong_gym_env import BrickPongEnv
+from brickpong_vec_env import BrickPongVecEnv
+from brickpong_replay_buffer import MemmapReplayBuffer
+from brickpong_shm_vec_env import SharedMemoryVecEnv
 import gymnasium as gym
 
 # Directory to save models and results
@@ -36,13 +39,35 @@ VIDEO_LENGTH = 500  # Steps to record for video
 
 N_CPUS = multiprocessing.cpu_count()
 
+# Train on the batched NumPy env (all matches stepped in one call) instead of
+# DummyVecEnv; set to False to fall back to one BrickPongEnv per worker.
+USE_VEC_ENV = True
+N_VEC_ENVS = 256
+
+# Without the batched env, BrickPongEnv copies run in one worker process per core and
+# share observations through shared memory (DummyVecEnv is kept for the non-vector obs modes)
+ENVS_PER_WORKER = 4
+
+# Physics ticks per agent decision (frame-skip), for both envs; sweep 1, 2, 4, 8
+ACTION_REPEAT = 1
+
+# "compact" stores int16/int8 observations (~2.4x smaller DQN/QRDQN replay buffers,
+# see `python brickpong_gym_env.py`); it needs BrickPongEnv, not the batched env
+OBS_MODE = "vector"
+POLICY = "MlpPolicy" if OBS_MODE == "vector" else "MultiInputPolicy"
+
+# Keep the DQN/QRDQN replay buffers in memory-mapped files under MODEL_DIR instead of RAM.
+# A rerun picks up the buffer where the last run stopped. Needs Box observations (OBS_MODE = "vector").
+USE_MEMMAP_REPLAY = False
+MEMMAP_BUFFER_SIZE = 10_000_000
+
 def make_env():
     # Create environment without render_mode parameter
-    return Monitor(BrickPongEnv(rl_mode=True))  # No rendering during training
+    return Monitor(BrickPongEnv(rl_mode=True, action_repeat=ACTION_REPEAT, obs_mode=OBS_MODE))  # No rendering during training
 
 def make_visual_env():
     # Create environment for visual evaluation/recording
-    return Monitor(BrickPongEnv(rl_mode=False))  
+    return Monitor(BrickPongEnv(rl_mode=False, action_repeat=ACTION_REPEAT, obs_mode=OBS_MODE))  
 
 def record_video(algo_name, model, video_length=VIDEO_LENGTH):
     # Only record video if explicitly needed - it's slow
@@ -105,11 +130,25 @@ for algo_name, algo_class in algorithms.items():
     print(f"\n=== Training {algo_name} ===")
     
     # Create a vectorized environment for training
-    env = DummyVecEnv([make_env for _ in range(min(N_CPUS, 4))])  # Limit to 4 CPUs to avoid memory issues
+    if USE_VEC_ENV and OBS_MODE == "vector":
+        env = VecMonitor(BrickPongVecEnv(num_envs=N_VEC_ENVS, action_repeat=ACTION_REPEAT))
+    elif OBS_MODE == "vector":
+        env = VecMonitor(SharedMemoryVecEnv(num_envs=N_CPUS * ENVS_PER_WORKER, n_workers=N_CPUS,
+                                            env_kwargs={"action_repeat": ACTION_REPEAT}))
+    else:
+        env = DummyVecEnv([make_env for _ in range(min(N_CPUS, 4))])  # Limit to 4 CPUs to avoid memory issues
     
     # Create and train the model
-    model = algo_class("MlpPolicy", env, verbose=1)
+    model_kwargs = {}
+    if USE_MEMMAP_REPLAY and algo_name in ("DQN", "QRDQN"):
+        model_kwargs = {
+            "buffer_size": MEMMAP_BUFFER_SIZE,
+            "replay_buffer_class": MemmapReplayBuffer,
+            "replay_buffer_kwargs": {"path": os.path.join(MODEL_DIR, f"{algo_name}_replay")},
+        }
+    model = algo_class(POLICY, env, verbose=1, **model_kwargs)
     model.learn(total_timesteps=NUM_TRAIN_STEPS)
+    env.close()  # Stops SharedMemoryVecEnv workers before the next algorithm starts its own
     
     # Save the trained model
     model_path = os.path.join(MODEL_DIR, f"{algo_name}_model")
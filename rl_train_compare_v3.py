@@ -37,12 +37,15 @@ VIDEO_LENGTH = 500  # Steps to record for video
 
 N_CPUS = multiprocessing.cpu_count()
 
+# Physics ticks per agent decision for BrickPongEnv (frame-skip); sweep 1, 2, 4, 8
+ACTION_REPEAT = 1
+
 def make_env():
-    return Monitor(BrickPongEnv(rl_mode=True))
+    return Monitor(BrickPongEnv(rl_mode=True, action_repeat=ACTION_REPEAT))
 
 def record_video(algo_name, model, env, video_length=VIDEO_LENGTH):
     # Wrap env for video recording
-    venv = DummyVecEnv([lambda: Monitor(BrickPongEnv())])
+    venv = DummyVecEnv([lambda: Monitor(BrickPongEnv(action_repeat=ACTION_REPEAT))])
     venv = VecVideoRecorder(
         venv, VIDEO_DIR, record_video_trigger=lambda x: x == 0,
         video_length=video_length, name_prefix=f"{algo_name}_agent"
@@ -56,7 +59,7 @@ def record_video(algo_name, model, env, video_length=VIDEO_LENGTH):
     venv.close()
 
 def train_batch(algo_name, algo_class, batch_id, return_dict, progress_queue, vis_queue):
-    env = Monitor(BrickPongEnv(rl_mode=True))
+    env = Monitor(BrickPongEnv(rl_mode=True, action_repeat=ACTION_REPEAT))
     model = algo_class("MlpPolicy", env, verbose=0)
     rewards = []
     for i in range(500):
@@ -114,7 +117,7 @@ if __name__ == "__main__":
             while not vis_queue.empty():
                 batch_id, ep_num, model_path = vis_queue.get()
                 print(f"\n[Visualizing] Batch {batch_id}, Episode {ep_num}")
-                env = Monitor(BrickPongEnv(rl_mode=False))
+                env = Monitor(BrickPongEnv(rl_mode=False, action_repeat=ACTION_REPEAT))
                 model = algo_class.load(model_path, env=env)
                 obs, _ = env.reset()
                 done = False
@@ -137,7 +140,7 @@ if __name__ == "__main__":
     random_batch_id = random.choice(list(return_dict.keys()))
     random_model_path = return_dict[random_batch_id][1]
     print(f"Visualizing random batch: {random_batch_id} ({random_model_path})")
-    env = Monitor(BrickPongEnv(rl_mode=False))
+    env = Monitor(BrickPongEnv(rl_mode=False, action_repeat=ACTION_REPEAT))
     model = algo_class.load(random_model_path, env=env)
     obs, _ = env.reset()
     done = False
@@ -149,7 +152,7 @@ if __name__ == "__main__":
     env.close()
 
     # Continue with best model as before...
-    env = Monitor(BrickPongEnv(rl_mode=False))
+    env = Monitor(BrickPongEnv(rl_mode=False, action_repeat=ACTION_REPEAT))
     model = algo_class.load(best_model_path, env=env)
     for i in tqdm(range(500, NUM_TRAIN_STEPS), desc="Visual Training"):
         obs, _ = env.reset()
@@ -0,0 +1,123 @@
+import pygame
+
+from game_core import BALL_RADIUS, BRICK_COLORS, BRICK_HEIGHT, BRICK_WIDTH, POWERUP_COLORS, Brick
+
+# ---------------------------- SPRITE GEOMETRY ----------------------------
+BALL_SIZE = BALL_RADIUS * 2
+BALL_GLOW_MARGIN = 3        # Glow ring sits this far outside the ball
+POWERUP_SIZE = 30
+MAX_POWERUP_GLOW = 8        # Glow ring grows out to this many pixels as the power-up pulses
+MAX_BOSS_HITS = 20          # Boss damage levels pre-rendered (bosses have 2 x level hits)
+
+BALL_GLOW_COLOR = (200, 200, 255)
+GAME_TRAILS = ((BALL_RADIUS - 2, 255), (BALL_RADIUS - 4, 255), (BALL_RADIUS - 6, 255))   # multi_brick.py
+ENV_TRAILS = ((BALL_RADIUS, 255), (BALL_RADIUS - 1, 195), (BALL_RADIUS - 2, 135))        # BrickPongEnv.render
+
+def draw_brick_shape(surface, rect, color):
+    """Brick body with 3D edges; the bottom and right edges sit one pixel past rect."""
+    # Main brick body
+    pygame.draw.rect(surface, color, rect)
+
+    # 3D effect - top and left edges (lighter)
+    light_color = tuple(min(c + 40, 255) for c in color)
+    pygame.draw.line(surface, light_color, rect.topleft, rect.topright)
+    pygame.draw.line(surface, light_color, rect.topleft, rect.bottomleft)
+
+    # 3D effect - bottom and right edges (darker)
+    dark_color = tuple(max(c - 40, 0) for c in color)
+    pygame.draw.line(surface, dark_color, rect.bottomleft, rect.bottomright)
+    pygame.draw.line(surface, dark_color, rect.topright, rect.bottomright)
+
+def damage_colors(brick_type, hits):
+    """Colors a brick of this type goes through as it takes hits, starting undamaged."""
+    brick = object.__new__(Brick)  # Skip __init__, which draws a random direction for moving bricks
+    brick.type = brick_type
+    brick.hits = hits
+    brick.color = BRICK_COLORS[brick_type]
+    colors = [brick.color]
+    while brick.hits > 1:
+        brick.hit()
+        colors.append(brick.color)
+    return colors
+
+class SpriteAtlas:
+    """
+    Pre-rendered brick, ball and power-up sprites, so drawing is blits only.
+    With scale > 1 sprites are 1/scale size; lookups still take sizes in game pixels.
+    """
+
+    def __init__(self, scale=1):
+        self.scale = scale
+        self.glow_margin = BALL_GLOW_MARGIN // scale       # Offsets for blitting glows in sprite pixels
+        self.powerup_margin = MAX_POWERUP_GLOW // scale
+        self.bricks = {}
+        for brick_type, hits in ((1, 1), (2, 3), (3, 1), (4, MAX_BOSS_HITS), (5, 2)):
+            for color in damage_colors(brick_type, hits):
+                self._render_brick(color, BRICK_WIDTH, BRICK_HEIGHT)
+
+        ball_size = self.px(BALL_SIZE)
+        self.ball = pygame.Surface((ball_size, ball_size), pygame.SRCALPHA)
+        pygame.draw.ellipse(self.ball, (255, 255, 255), self.ball.get_rect())
+        self.ball = self.ball.convert_alpha()
+        self.glows = {}
+        self.trails = {}
+        for alpha in (255, 100):
+            self.glow(alpha)
+        for radius, alpha in GAME_TRAILS + ENV_TRAILS:
+            self.trail(radius, alpha)
+
+        self.powerups = {}
+        for color in POWERUP_COLORS.values():
+            for glow_size in range(MAX_POWERUP_GLOW + 1):
+                self.powerup(color, glow_size)
+
+    def px(self, length):
+        """A length in game pixels, in sprite pixels (at least one)."""
+        return max(1, length // self.scale)
+
+    def _render_brick(self, color, width, height):
+        surface = pygame.Surface((self.px(width) + 1, self.px(height) + 1)).convert()
+        draw_brick_shape(surface, pygame.Rect(0, 0, self.px(width), self.px(height)), color)
+        self.bricks[(color, width, height)] = surface
+        return surface
+
+    def brick(self, brick):
+        sprite = self.bricks.get((brick.color, brick.rect.width, brick.rect.height))
+        if sprite is None:
+            sprite = self._render_brick(brick.color, brick.rect.width, brick.rect.height)
+        return sprite
+
+    def glow(self, alpha):
+        """Ring around a ball; blit it glow_margin up and left of the ball."""
+        sprite = self.glows.get(alpha)
+        if sprite is None:
+            size = self.px(BALL_SIZE) + 2 * self.glow_margin
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.ellipse(sprite, BALL_GLOW_COLOR + (alpha,), sprite.get_rect(), self.px(2))
+            self.glows[alpha] = sprite = sprite.convert_alpha()
+        return sprite
+
+    def trail(self, radius, alpha):
+        """Filled circle; blit it half its width up and left of its centre."""
+        sprite = self.trails.get((radius, alpha))
+        if sprite is None:
+            size = self.px(radius)
+            sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (255, 255, 255, alpha), (size, size), size)
+            self.trails[(radius, alpha)] = sprite = sprite.convert_alpha()
+        return sprite
+
+    def powerup(self, color, glow_size):
+        """Power-up with its glow ring; blit it powerup_margin up and left of the power-up."""
+        glow_size = min(max(glow_size, 0), MAX_POWERUP_GLOW)
+        sprite = self.powerups.get((color, glow_size))
+        if sprite is None:
+            margin = self.powerup_margin
+            size = self.px(POWERUP_SIZE) + 2 * margin
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            body = pygame.Rect(margin, margin, self.px(POWERUP_SIZE), self.px(POWERUP_SIZE))
+            pygame.draw.ellipse(sprite, color, body)
+            ring = 2 * (glow_size // self.scale)
+            pygame.draw.ellipse(sprite, color, body.inflate(ring, ring), self.px(2))
+            self.powerups[(color, glow_size)] = sprite = sprite.convert_alpha()
+        return sprite